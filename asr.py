@@ -0,0 +1,50 @@
+# asr.py
+import json
+from whisper_stream import transcribe_stream
+
+
+class VoskASR:
+    def __init__(self, recognizer):
+        self.recognizer = recognizer
+
+    def process(self, data, on_partial=None):
+        if not isinstance(data, bytes):
+            data = bytes(data)
+        if self.recognizer.AcceptWaveform(data):
+            result_dict = json.loads(self.recognizer.Result())
+            return result_dict.get("text", "") or None
+
+        partial_dict = json.loads(self.recognizer.PartialResult())
+        partial = partial_dict.get("partial", "")
+        if partial and on_partial:
+            on_partial(partial)
+        return None
+
+    def flush(self):
+        result_dict = json.loads(self.recognizer.FinalResult())
+        return result_dict.get("text", "") or None
+
+
+class WhisperASR:
+    def __init__(self, model):
+        self.model = model
+
+    def process(self, audio, on_partial=None):
+        result = self.model.transcribe(audio)
+        return result["text"].strip() or None
+
+    def flush(self):
+        return None
+
+
+class StreamingWhisperASR(WhisperASR):
+    def __init__(self, model, **vad_options):
+        super().__init__(model)
+        self.vad_options = vad_options
+
+    def stream(self, audio):
+        return transcribe_stream(self.model, audio, **self.vad_options)
+
+    def process(self, audio, on_partial=None):
+        text = " ".join(segment["text"] for segment in self.stream(audio))
+        return text or None
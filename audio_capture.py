@@ -0,0 +1,110 @@
+# audio_capture.py
+import threading
+import time
+import numpy as np
+import sounddevice as sd
+
+
+class AudioCapture:
+    def __init__(self, samplerate=16000, blocksize=1600, channels=1, slots=64):
+        self.samplerate = samplerate
+        self.blocksize = blocksize
+        self.channels = channels
+        self.slots = slots
+        self.buffer = np.zeros((slots, blocksize * channels), dtype=np.int16)
+        self.lengths = np.zeros(slots, dtype=np.int64)
+        self.timestamps = np.zeros(slots)
+        self.block_time = None
+        self.head = 0
+        self.tail = 0
+        self.filled = 0
+        self.reading = False
+        self.condition = threading.Condition()
+        self.stream = None
+        self.running = False
+
+        self.captured_blocks = 0
+        self.dropped_blocks = 0
+        self.input_overflows = 0
+        self.status_events = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        self.running = True
+        self.stream = sd.InputStream(
+            samplerate=self.samplerate,
+            blocksize=self.blocksize,
+            dtype='int16',
+            channels=self.channels,
+            callback=self.callback
+        )
+        self.stream.start()
+
+    def stop(self):
+        if self.stream is not None:
+            self.stream.stop()
+            self.stream.close()
+            self.stream = None
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+
+    def callback(self, indata, frames, time_info, status):
+        if status:
+            self.status_events += 1
+            if status.input_overflow:
+                self.input_overflows += 1
+
+        with self.condition:
+            # a full ring means the consumer is behind; drop the newest block rather than block the audio thread
+            if self.filled == self.slots:
+                self.dropped_blocks += 1
+                return
+            slot = self.head
+
+        samples = frames * self.channels
+        self.buffer[slot, :samples] = indata.reshape(-1)
+        self.lengths[slot] = samples
+        self.timestamps[slot] = time.monotonic()
+
+        with self.condition:
+            self.head = (slot + 1) % self.slots
+            self.filled += 1
+            self.captured_blocks += 1
+            self.condition.notify()
+
+    def read(self, timeout=None):
+        # the returned view aliases the ring slot; call release() once it has been consumed
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.filled > 0 or not self.running, timeout):
+                return None
+            if self.filled == 0:
+                return None
+            slot = self.tail
+            self.reading = True
+            self.block_time = self.timestamps[slot]
+        return memoryview(self.buffer[slot, :self.lengths[slot]])
+
+    def release(self):
+        with self.condition:
+            if not self.reading:
+                return
+            self.reading = False
+            self.tail = (self.tail + 1) % self.slots
+            self.filled -= 1
+
+    def stats(self):
+        with self.condition:
+            return {
+                "captured_blocks": self.captured_blocks,
+                "dropped_blocks": self.dropped_blocks,
+                "input_overflows": self.input_overflows,
+                "status_events": self.status_events,
+                "queued_blocks": self.filled
+            }
@@ -0,0 +1,130 @@
+# audio_grid.py
+import math
+import ttkbootstrap as ttk
+
+
+class AudioGrid:
+    def __init__(self, parent, store, tab, on_play, actions=(), rows=5, columns=2):
+        self.store = store
+        self.tab = tab
+        self.on_play = on_play
+        self.actions = list(actions)
+        self.rows = rows
+        self.columns = columns
+
+        self.frame = ttk.Frame(parent)
+        self.scrollbar = ttk.Scrollbar(self.frame, orient='vertical', command=self.scroll)
+        self.scrollbar.grid(column=columns, row=0, rowspan=rows, sticky='ns')
+
+        # a fixed pool of cells is reused for whichever clips are in view
+        self.cells = []
+        for index in range(rows * columns):
+            cell = ttk.Frame(self.frame)
+            cell.grid(row=index // columns, column=index % columns, padx=5, pady=5, sticky='nsew')
+            buttons = [ttk.Button(cell)]
+            for text, _ in self.actions:
+                buttons.append(ttk.Button(cell, text=text))
+            for column, button in enumerate(buttons):
+                button.grid(row=0, column=column, padx=5, pady=5, sticky='nsew')
+            for widget in [cell] + buttons:
+                widget.bind("<MouseWheel>", self.on_wheel)
+                widget.bind("<Button-4>", self.on_wheel)
+                widget.bind("<Button-5>", self.on_wheel)
+            cell.grid_remove()
+            self.cells.append((cell, buttons))
+        self.shown = [None] * len(self.cells)
+
+        self.first_row = 0
+        self.count = store.count_clips(tab)
+        self.set_first_row(self.last_first_row(), force=True)
+
+    def grid(self, **options):
+        self.frame.grid(**options)
+
+    @property
+    def total_rows(self):
+        return math.ceil(self.count / self.columns)
+
+    def last_first_row(self):
+        return max(0, self.total_rows - self.rows)
+
+    def set_first_row(self, row, force=False):
+        row = min(max(0, row), self.last_first_row())
+        if row != self.first_row or force:
+            self.first_row = row
+            self.refresh()
+        else:
+            self.update_scrollbar()
+
+    def refresh(self):
+        offset = self.first_row * self.columns
+        clips = self.store.clip_entries(self.tab, offset, len(self.cells))
+        for index in range(len(self.cells)):
+            if index < len(clips):
+                self.show(index, offset + index, *clips[index])
+            else:
+                self.hide(index)
+        self.update_scrollbar()
+
+    def show(self, index, position, clip_id, target=None):
+        # only touch widgets whose clip or number actually changed
+        if self.shown[index] == (position, clip_id, target):
+            return
+        cell, buttons = self.cells[index]
+        # broadcasts save one clip per language, so each button names its language
+        text = f"Play {position + 1}" if target is None else f"Play {position + 1} ({target})"
+        buttons[0].configure(text=text, command=lambda: self.on_play(clip_id))
+        for button, (_, callback) in zip(buttons[1:], self.actions):
+            button.configure(command=lambda callback=callback: callback(clip_id))
+        if self.shown[index] is None:
+            cell.grid()
+        self.shown[index] = (position, clip_id, target)
+
+    def hide(self, index):
+        if self.shown[index] is not None:
+            self.cells[index][0].grid_remove()
+            self.shown[index] = None
+
+    def update_scrollbar(self):
+        total_rows = self.total_rows
+        if total_rows <= self.rows:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.first_row / total_rows, (self.first_row + self.rows) / total_rows)
+
+    def add(self, clip_id, target=None):
+        following = self.first_row == self.last_first_row()
+        self.count += 1
+        position = self.count - 1
+        index = position - self.first_row * self.columns
+        if 0 <= index < len(self.cells):
+            self.show(index, position, clip_id, target)
+            self.update_scrollbar()
+        elif following:
+            self.set_first_row(self.last_first_row())
+        else:
+            self.update_scrollbar()
+
+    def remove(self, clip_id):
+        self.count = max(0, self.count - 1)
+        visible = [shown[1] for shown in self.shown if shown is not None]
+        # clips after the window do not change anything in view
+        if visible and clip_id > visible[-1] and len(visible) == len(self.cells):
+            self.set_first_row(self.first_row)
+        else:
+            self.set_first_row(self.first_row, force=True)
+
+    def scroll(self, *args):
+        if args[0] == "moveto":
+            self.set_first_row(int(float(args[1]) * self.total_rows))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= self.rows
+            self.set_first_row(self.first_row + step)
+
+    def on_wheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self.set_first_row(self.first_row - 1)
+        else:
+            self.set_first_row(self.first_row + 1)
@@ -0,0 +1,80 @@
+# benchmarks/audio_grid_stress.py
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tkinter as tk
+from audio_grid import AudioGrid
+from latency import percentile
+from session_store import SessionStore
+
+
+def timed(samples, action, *args):
+    start = time.perf_counter()
+    action(*args)
+    samples.append((time.perf_counter() - start) * 1000)
+
+
+def summarize(samples):
+    return {
+        "count": len(samples),
+        "p50_ms": percentile(samples, 0.50),
+        "p95_ms": percentile(samples, 0.95),
+        "max_ms": max(samples) if samples else None
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the audio grid with thousands of stored clips.")
+    parser.add_argument("--clips", type=int, default=5000)
+    parser.add_argument("--operations", type=int, default=200)
+    parser.add_argument("--max-ms", type=float, default=16.0, help="fail if any operation's p95 exceeds this")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = SessionStore(os.path.join(directory, "session.sqlite3"), os.path.join(directory, "audio.seg"))
+        silence = bytes(4410)
+        for _ in range(args.clips):
+            store.add_clip("stress", silence, 22050)
+
+        root = tk.Tk()
+        root.withdraw()
+        start = time.perf_counter()
+        grid = AudioGrid(root, store, "stress", on_play=lambda clip_id: None, actions=[("X", lambda clip_id: None)])
+        grid.grid(column=0, row=0)
+        root.update()
+        build_ms = (time.perf_counter() - start) * 1000
+
+        adds, removes, scrolls = [], [], []
+        for _ in range(args.operations):
+            clip_id = store.add_clip("stress", silence, 22050)
+            timed(adds, grid.add, clip_id)
+            root.update_idletasks()
+        for index in range(args.operations):
+            timed(scrolls, grid.scroll, "moveto", str(index / args.operations))
+            root.update_idletasks()
+        for clip_id in store.clip_ids("stress", 0, args.operations):
+            store.remove_clip(clip_id)
+            timed(removes, grid.remove, clip_id)
+            root.update_idletasks()
+
+        root.destroy()
+        store.close()
+
+    report = {
+        "clips": args.clips,
+        "build_ms": build_ms,
+        "add": summarize(adds),
+        "scroll": summarize(scrolls),
+        "remove": summarize(removes)
+    }
+    print(json.dumps(report, indent=2))
+    slow = [name for name in ("add", "scroll", "remove") if report[name]["p95_ms"] > args.max_ms]
+    if slow:
+        sys.exit(f"p95 above {args.max_ms} ms for: {', '.join(slow)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+# benchmarks/end_to_end.py
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import time
+from benchmarks.fake_services import FakeServices
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_ENGINES = [
+    "vosk:small", "vosk:large",
+    "whisper:tiny", "whisper:base", "whisper:small", "whisper:medium", "whisper:large"
+]
+VOSK_CHUNK_SECONDS = 0.1
+
+
+class TimedASR:
+    def __init__(self, asr):
+        self.asr = asr
+        self.seconds = 0.0
+        if hasattr(asr, "stream"):
+            self.stream = self.timed_stream
+
+    def process(self, data, on_partial=None):
+        start = time.perf_counter()
+        try:
+            return self.asr.process(data, on_partial)
+        finally:
+            self.seconds += time.perf_counter() - start
+
+    def flush(self):
+        start = time.perf_counter()
+        try:
+            return self.asr.flush()
+        finally:
+            self.seconds += time.perf_counter() - start
+
+    def timed_stream(self, audio):
+        segments = self.asr.stream(audio)
+        while True:
+            start = time.perf_counter()
+            try:
+                segment = next(segments)
+            except StopIteration:
+                return
+            finally:
+                self.seconds += time.perf_counter() - start
+            yield segment
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def load_engine(engine, options):
+    kind, _, size = engine.partition(":")
+    if kind == "vosk":
+        from asr import VoskASR
+        from model_registry import get_registry
+        recognizer = get_registry().recognizer(options["language"], size)
+        return VoskASR(recognizer)
+    if kind == "whisper":
+        from asr import StreamingWhisperASR
+        from whisper_backends import get_backend
+        model = get_backend(options["backend"]).load(size)
+        return StreamingWhisperASR(model)
+    raise ValueError(f"Unknown engine '{engine}'")
+
+
+def feed_clip(pipeline, engine, audio):
+    if engine.startswith("vosk"):
+        pcm = (audio.clip(-1.0, 1.0) * 32767).astype("int16").tobytes()
+        chunk_bytes = int(16000 * VOSK_CHUNK_SECONDS) * 2
+        for offset in range(0, len(pcm), chunk_bytes):
+            pipeline.feed_audio(pcm[offset:offset + chunk_bytes])
+        pipeline.flush_audio()
+    else:
+        pipeline.feed_audio(audio)
+
+
+def run_engine(engine, clip_paths, options):
+    # runs in a fresh process so the peak RSS belongs to this engine alone
+    from latency import LatencyTracker
+    from pipeline import SpeechPipeline
+    from translation import Translator
+    from tts import ElevenLabsTTS
+    from whisper_stream import load_audio
+
+    clips = [load_audio(path) for path in clip_paths]
+    audio_seconds = sum(len(audio) for audio in clips) / 16000
+
+    start = time.perf_counter()
+    asr = TimedASR(load_engine(engine, options))
+    load_seconds = time.perf_counter() - start
+
+    utterances = []
+    errors = []
+    tracker = LatencyTracker(window=100000)
+    pipeline = SpeechPipeline(
+        asr=asr,
+        translator=Translator(base_url=options["translate_url"]),
+        tts=ElevenLabsTTS("benchmark-key", "benchmark-voice", base_url=options["tts_url"]),
+        target=options["target"],
+        on_event=lambda event, utterance: utterances.append(utterance) if event == "synthesized" else None,
+        on_error=lambda stage, item, error: errors.append(f"{stage}: {error}"),
+        maxsize=64,
+        latency=tracker
+    )
+
+    start = time.perf_counter()
+    pipeline.start()
+    for audio in clips:
+        feed_clip(pipeline, engine, audio)
+    pipeline.stop()
+    wall_seconds = time.perf_counter() - start
+
+    return {
+        "engine": engine,
+        "load_seconds": load_seconds,
+        "audio_seconds": audio_seconds,
+        "wall_seconds": wall_seconds,
+        "asr_seconds": asr.seconds,
+        "rtf": asr.seconds / audio_seconds if audio_seconds else None,
+        "audio_seconds_per_second": audio_seconds / wall_seconds if wall_seconds else None,
+        "utterances": len(utterances),
+        "utterances_per_second": len(utterances) / wall_seconds if wall_seconds else None,
+        "peak_rss_mb": peak_rss_mb(),
+        "stages": {span: stats for span, stats in tracker.summary().items() if stats["count"]},
+        "errors": errors[:20]
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark recognition, translation and TTS end to end against local fake services.")
+    parser.add_argument("clips_dir", help="folder of .wav fixtures")
+    parser.add_argument("--engines", nargs="+", default=DEFAULT_ENGINES, help="engine:size pairs, e.g. vosk:small whisper:base")
+    parser.add_argument("--language", default="English", help="Vosk model language")
+    parser.add_argument("--backend", default="openai-whisper", help="Whisper backend")
+    parser.add_argument("--target", default="es")
+    parser.add_argument("--translate-latency", type=float, default=0.15)
+    parser.add_argument("--tts-first-byte", type=float, default=0.3)
+    parser.add_argument("--tts-chunk-interval", type=float, default=0.05)
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    clip_paths = sorted(glob.glob(os.path.join(args.clips_dir, "*.wav")))
+    if not clip_paths:
+        sys.exit(f"No .wav clips found in {args.clips_dir}")
+
+    services = FakeServices(
+        translate_latency=args.translate_latency,
+        tts_first_byte=args.tts_first_byte,
+        tts_chunk_interval=args.tts_chunk_interval
+    )
+    report = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "clips": [os.path.basename(path) for path in clip_paths],
+        "services": services.settings(),
+        "engines": []
+    }
+
+    context = multiprocessing.get_context("spawn")
+    with services:
+        options = {
+            "language": args.language,
+            "backend": args.backend,
+            "target": args.target,
+            "translate_url": services.translate_url,
+            "tts_url": services.tts_url
+        }
+        for engine in args.engines:
+            print(f"Benchmarking {engine}...", file=sys.stderr)
+            with context.Pool(1) as pool:
+                try:
+                    result = pool.apply(run_engine, (engine, clip_paths, options))
+                except Exception as e:
+                    result = {"engine": engine, "error": str(e)}
+            report["engines"].append(result)
+        report["requests"] = dict(services.requests)
+
+    output = json.dumps(report, indent=2, sort_keys=True, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# benchmarks/fake_services.py
+import html
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+PCM_SAMPLE_RATE = 22050
+
+
+class FakeServiceHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != "/m":
+            self.send_error(404)
+            return
+
+        services = self.server.services
+        services.count("translate")
+        query = parse_qs(url.query)
+        text = query.get("q", [""])[0]
+        target = query.get("tl", ["en"])[0]
+        time.sleep(services.translate_latency)
+
+        # same markup GoogleTranslator scrapes from translate.google.com/m
+        body = f'<html><body><div class="result-container">{html.escape(f"[{target}] {text}")}</div></body></html>'
+        self.send_body(body.encode("utf-8"), "text/html; charset=utf-8")
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        parts = url.path.strip("/").split("/")
+        if len(parts) < 3 or parts[:2] != ["v1", "text-to-speech"]:
+            self.send_error(404)
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        text = json.loads(self.rfile.read(length) or b"{}").get("text", "")
+        services = self.server.services
+        if self.headers.get("xi-api-key") is None:
+            self.send_body(b'{"detail": "missing api key"}', "application/json", status=401)
+            return
+
+        audio = bytes(int(len(text) * services.tts_seconds_per_char * PCM_SAMPLE_RATE) * 2)
+        if parts[-1] == "stream":
+            services.count("tts_stream")
+            self.stream_body(audio, services)
+        else:
+            services.count("tts")
+            chunks = len(audio) // services.tts_chunk_bytes
+            time.sleep(services.tts_first_byte + services.tts_chunk_interval * chunks)
+            self.send_body(audio, "audio/mpeg")
+
+    def send_body(self, body, content_type, status=200):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def stream_body(self, audio, services):
+        time.sleep(services.tts_first_byte)
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/pcm")
+        self.send_header("Content-Length", str(len(audio)))
+        self.end_headers()
+        for offset in range(0, len(audio), services.tts_chunk_bytes):
+            if offset:
+                time.sleep(services.tts_chunk_interval)
+            self.wfile.write(audio[offset:offset + services.tts_chunk_bytes])
+            self.wfile.flush()
+
+
+class FakeServices:
+    def __init__(self, translate_latency=0.15, tts_first_byte=0.3, tts_chunk_interval=0.05,
+                 tts_chunk_bytes=8192, tts_seconds_per_char=0.06, host="127.0.0.1", port=0):
+        self.translate_latency = translate_latency
+        self.tts_first_byte = tts_first_byte
+        self.tts_chunk_interval = tts_chunk_interval
+        self.tts_chunk_bytes = tts_chunk_bytes
+        self.tts_seconds_per_char = tts_seconds_per_char
+        self.requests = {}
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), FakeServiceHandler)
+        self.server.daemon_threads = True
+        self.server.services = self
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def translate_url(self):
+        return f"{self.base_url}/m"
+
+    @property
+    def tts_url(self):
+        return f"{self.base_url}/v1"
+
+    def settings(self):
+        return {
+            "translate_latency": self.translate_latency,
+            "tts_first_byte": self.tts_first_byte,
+            "tts_chunk_interval": self.tts_chunk_interval,
+            "tts_chunk_bytes": self.tts_chunk_bytes,
+            "tts_seconds_per_char": self.tts_seconds_per_char
+        }
+
+    def count(self, endpoint):
+        with self.lock:
+            self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, name="fake-services", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,24 @@
+# benchmarks/scoring.py
+import re
+
+_PUNCTUATION = re.compile(r"[^\w\s']")
+
+
+def normalize_words(text):
+    return _PUNCTUATION.sub(" ", text.lower()).split()
+
+
+def word_error_rate(reference, hypothesis):
+    reference_words = normalize_words(reference)
+    hypothesis_words = normalize_words(hypothesis)
+    if not reference_words:
+        return 0.0 if not hypothesis_words else 1.0
+
+    previous = list(range(len(hypothesis_words) + 1))
+    for i, reference_word in enumerate(reference_words, 1):
+        current = [i] + [0] * len(hypothesis_words)
+        for j, hypothesis_word in enumerate(hypothesis_words, 1):
+            substitution = previous[j - 1] + (reference_word != hypothesis_word)
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, substitution)
+        previous = current
+    return previous[-1] / len(reference_words)
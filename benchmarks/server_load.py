@@ -0,0 +1,161 @@
+# benchmarks/server_load.py
+import argparse
+import asyncio
+import glob
+import json
+import os
+import sys
+import time
+import numpy as np
+import websockets
+from latency import percentile
+from resampling import load_mono
+from server import DEFAULT_PORT
+
+SAMPLE_RATE = 16000
+
+
+def load_pcm(path):
+    audio = load_mono(path, SAMPLE_RATE)
+    return (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+
+
+async def replay(url, pcm, config, chunk_seconds, speed):
+    chunk_bytes = int(SAMPLE_RATE * chunk_seconds) * 2
+    latencies = []
+    finals = 0
+    last_sent = None
+    behind = 0.0
+
+    async with websockets.connect(url, max_size=2 ** 22) as websocket:
+        await websocket.send(json.dumps(config))
+        ready = json.loads(await websocket.recv())
+        if ready.get("type") != "ready":
+            raise RuntimeError(ready.get("message", "server refused the session"))
+
+        async def receive():
+            nonlocal finals
+            async for message in websocket:
+                if isinstance(message, bytes):
+                    continue
+                event = json.loads(message)
+                if event["type"] in ("partial", "final") and last_sent is not None:
+                    # how far the server trails the newest audio it has been given
+                    latencies.append(time.perf_counter() - last_sent)
+                    finals += event["type"] == "final"
+                elif event["type"] in ("done", "error"):
+                    return event
+
+        receiver = asyncio.create_task(receive())
+        start = time.perf_counter()
+        for index, offset in enumerate(range(0, len(pcm), chunk_bytes)):
+            due = start + index * chunk_seconds / speed
+            delay = due - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                behind = max(behind, -delay)
+            await websocket.send(pcm[offset:offset + chunk_bytes])
+            last_sent = time.perf_counter()
+        await websocket.send(json.dumps({"type": "eof"}))
+        event = await receiver
+
+    return {
+        "audio_seconds": len(pcm) / 2 / SAMPLE_RATE,
+        "wall_seconds": time.perf_counter() - start,
+        "events": len(latencies),
+        "finals": finals,
+        "latency_p50": percentile(latencies, 0.50),
+        "latency_p95": percentile(latencies, 0.95),
+        "max_send_lag": behind,
+        "server_cpu_count": ready.get("cpu_count"),
+        "error": event.get("message") if event and event["type"] == "error" else None
+    }
+
+
+async def run_level(url, clips, sessions, config, chunk_seconds, speed):
+    tasks = [
+        replay(url, clips[index % len(clips)], config, chunk_seconds, speed)
+        for index in range(sessions)
+    ]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    streams = []
+    for result in results:
+        streams.append({"error": str(result)} if isinstance(result, Exception) else result)
+    return streams
+
+
+def summarize(sessions, streams, max_latency):
+    ok = [stream for stream in streams if not stream.get("error")]
+    p95s = [stream["latency_p95"] for stream in ok if stream["latency_p95"] is not None]
+    worst_p95 = max(p95s) if p95s else None
+    return {
+        "sessions": sessions,
+        "failed": len(streams) - len(ok),
+        "worst_p95": worst_p95,
+        "median_p50": percentile([stream["latency_p50"] for stream in ok if stream["latency_p50"] is not None], 0.5),
+        "sustained": len(ok) == len(streams) and worst_p95 is not None and worst_p95 <= max_latency,
+        "streams": streams
+    }
+
+
+async def load_test(args, clips):
+    url = f"ws://{args.host}:{args.port}"
+    config = {"language": args.language, "size": args.size, "target": args.target}
+    levels = []
+    sustainable = 0
+    for sessions in args.sessions:
+        level = summarize(sessions, await run_level(url, clips, sessions, config, args.chunk_seconds, args.speed), args.max_latency)
+        levels.append(level)
+        print(f"{sessions:4d} sessions: worst p95 {level['worst_p95']}, failed {level['failed']}", file=sys.stderr)
+        if not level["sustained"]:
+            break
+        sustainable = sessions
+    return levels, sustainable
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay WAV files against the recognition server and find its session capacity.")
+    parser.add_argument("clips_dir", help="folder of .wav clips to replay")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--language", default="English")
+    parser.add_argument("--size", default="small")
+    parser.add_argument("--target", help="also request translations into this language code")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32, 64])
+    parser.add_argument("--chunk-seconds", type=float, default=0.1)
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed; 1.0 is real time")
+    parser.add_argument("--max-latency", type=float, default=0.5, help="p95 seconds a level may reach and still count as sustained")
+    parser.add_argument("--cpu-count", type=int, help="cores on the server host; defaults to what the server reports")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    clips = [load_pcm(path) for path in sorted(glob.glob(os.path.join(args.clips_dir, "*.wav")))]
+    if not clips:
+        sys.exit(f"No .wav clips found in {args.clips_dir}")
+
+    levels, sustainable = asyncio.run(load_test(args, clips))
+    cpu_count = args.cpu_count
+    if cpu_count is None:
+        reported = [stream.get("server_cpu_count") for level in levels for stream in level["streams"]]
+        cpu_count = next((count for count in reported if count), None)
+    report = {
+        "server": f"{args.host}:{args.port}",
+        "model": f"{args.language}/{args.size}",
+        "max_latency": args.max_latency,
+        "max_sustained_sessions": sustainable,
+        "server_cpu_count": cpu_count,
+        "sessions_per_core": sustainable / cpu_count if cpu_count else None,
+        "levels": levels
+    }
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/startup.py
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import main
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "heavy_modules": [m for m in ("whisper", "torch") if m in sys.modules]}))
+"""
+
+WINDOW_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import main
+root = main.ttk.Window(themename="solar")
+app = main.MainApplication(root)
+root.update()
+elapsed = time.perf_counter() - start
+root.destroy()
+print(json.dumps({"seconds": elapsed, "heavy_modules": [m for m in ("whisper", "torch") if m in sys.modules]}))
+"""
+
+
+def run_probe(probe):
+    output = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure Tower of Babel startup time.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--window", action="store_true", help="also build the main window (needs a display)")
+    parser.add_argument("--max-seconds", type=float, default=None, help="exit non-zero if the median exceeds this")
+    args = parser.parse_args()
+
+    probe = WINDOW_PROBE if args.window else IMPORT_PROBE
+    results = [run_probe(probe) for _ in range(args.runs)]
+    timings = [result["seconds"] for result in results]
+    heavy_modules = sorted({name for result in results for name in result["heavy_modules"]})
+
+    report = {
+        "probe": "window" if args.window else "import",
+        "runs": args.runs,
+        "median_seconds": statistics.median(timings),
+        "max_seconds": max(timings),
+        "heavy_modules_at_startup": heavy_modules
+    }
+    print(json.dumps(report, indent=2))
+
+    if heavy_modules:
+        sys.exit("whisper/torch were imported during startup")
+    if args.max_seconds is not None and report["median_seconds"] > args.max_seconds:
+        sys.exit(f"startup regressed: {report['median_seconds']:.2f}s > {args.max_seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
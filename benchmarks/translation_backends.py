@@ -0,0 +1,127 @@
+# benchmarks/translation_backends.py
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from benchmarks.fake_services import FakeServices
+from http_client import DEFAULT_REQUESTS_PER_SECOND, HttpClient
+from latency import percentile
+from translation import Translator
+from translation_backends import BACKENDS, DEFAULT_LOCAL_MODEL_DIR, get_backend
+
+SENTENCES = [
+    "Good morning, everyone, and thank you for coming.",
+    "Please take your seats, the session is about to begin.",
+    "Today we will talk about the new train schedule.",
+    "The museum opens at nine and closes at five.",
+    "Could you tell me where the nearest pharmacy is?",
+    "We have prepared a short presentation on the project.",
+    "Lunch will be served in the main hall at noon.",
+    "If you have any questions, raise your hand.",
+    "The weather should be sunny for the rest of the week.",
+    "Thank you all for your patience during the delay.",
+    "The next speaker will cover the budget for next year.",
+    "Let us take a ten minute break before we continue.",
+]
+
+
+def summarize(samples):
+    return {
+        "count": len(samples),
+        "p50_ms": percentile(samples, 0.50),
+        "p95_ms": percentile(samples, 0.95),
+        "max_ms": max(samples) if samples else None
+    }
+
+
+def make_backend(name, args, translate_url):
+    if name == "google":
+        client = HttpClient(requests_per_second=args.requests_per_second)
+        return get_backend(name, source=args.source, client=client, base_url=translate_url)
+    if name == "marian-ct2":
+        return get_backend(name, source=args.source, model_dir=args.model_dir)
+    return get_backend(name, source=args.source)
+
+
+def run_backend(name, sentences, args, translate_url):
+    start = time.perf_counter()
+    backend = make_backend(name, args, translate_url)
+    translator = Translator(backend=backend)
+    # the first call loads local models; it is reported apart from steady state
+    translator.translate(sentences[0], args.target)
+    warmup_seconds = time.perf_counter() - start
+
+    latencies = []
+    for sentence in sentences:
+        started = time.perf_counter()
+        translator.translate(sentence, args.target)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    throughput = {}
+    for batch_size in args.batch_sizes:
+        started = time.perf_counter()
+        for offset in range(0, len(sentences), batch_size):
+            translator.translate_batch(sentences[offset:offset + batch_size], args.target)
+        seconds = time.perf_counter() - started
+        throughput[str(batch_size)] = len(sentences) / seconds if seconds else None
+
+    return {
+        "backend": name,
+        "warmup_seconds": warmup_seconds,
+        "latency": summarize(latencies),
+        "sentences_per_second": throughput
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare translation backends on per-utterance latency and batched throughput.")
+    parser.add_argument("--backends", nargs="+", choices=list(BACKENDS), default=list(BACKENDS))
+    parser.add_argument("--source", default="en")
+    parser.add_argument("--target", default="es")
+    parser.add_argument("--sentences", type=int, default=96)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--model-dir", default=DEFAULT_LOCAL_MODEL_DIR, help="converted local models")
+    parser.add_argument("--remote-url", help="translate endpoint for the google backend; local fake service by default")
+    parser.add_argument("--translate-latency", type=float, default=0.15, help="fake service delay per request")
+    parser.add_argument("--requests-per-second", type=float, default=DEFAULT_REQUESTS_PER_SECOND,
+                        help="request budget for the remote backend, as the app uses it")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    # numbered so no two requests are identical
+    sentences = [f"{SENTENCES[index % len(SENTENCES)]} ({index})" for index in range(args.sentences)]
+    services = FakeServices(translate_latency=args.translate_latency)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "source": args.source,
+        "target": args.target,
+        "sentences": len(sentences),
+        "remote": args.remote_url or services.settings(),
+        "backends": []
+    }
+
+    with services:
+        translate_url = args.remote_url or services.translate_url
+        for name in args.backends:
+            print(f"Benchmarking {name}...", file=sys.stderr)
+            try:
+                result = run_backend(name, sentences, args, translate_url)
+            except Exception as e:
+                result = {"backend": name, "error": str(e)}
+            report["backends"].append(result)
+        report["requests"] = dict(services.requests)
+
+    output = json.dumps(report, indent=2, sort_keys=True, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# benchmarks/whisper_rtf.py
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+import soundfile as sf
+from benchmarks.scoring import word_error_rate
+from whisper_backends import BACKENDS, get_backend
+
+
+def load_clips(clips_dir):
+    clips = []
+    for audio_path in sorted(glob.glob(os.path.join(clips_dir, "*.wav"))):
+        reference_path = os.path.splitext(audio_path)[0] + ".txt"
+        reference = None
+        if os.path.exists(reference_path):
+            with open(reference_path, encoding="utf-8") as f:
+                reference = f.read().strip()
+        clips.append((audio_path, reference, sf.info(audio_path).duration))
+    return clips
+
+
+def benchmark_backend(backend_name, model_name, clips):
+    start = time.perf_counter()
+    model = get_backend(backend_name).load(model_name)
+    load_seconds = time.perf_counter() - start
+
+    results = []
+    for audio_path, reference, duration in clips:
+        start = time.perf_counter()
+        text = model.transcribe(audio_path)["text"]
+        elapsed = time.perf_counter() - start
+        results.append({
+            "clip": os.path.basename(audio_path),
+            "audio_seconds": duration,
+            "transcribe_seconds": elapsed,
+            "rtf": elapsed / duration if duration else None,
+            "wer": word_error_rate(reference, text) if reference is not None else None,
+            "text": text.strip()
+        })
+
+    audio_seconds = sum(result["audio_seconds"] for result in results)
+    transcribe_seconds = sum(result["transcribe_seconds"] for result in results)
+    scored = [result for result in results if result["wer"] is not None]
+    return {
+        "backend": backend_name,
+        "model": model_name,
+        "load_seconds": load_seconds,
+        "audio_seconds": audio_seconds,
+        "transcribe_seconds": transcribe_seconds,
+        "rtf": transcribe_seconds / audio_seconds if audio_seconds else None,
+        "mean_wer": sum(result["wer"] for result in scored) / len(scored) if scored else None,
+        "clips": results
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Whisper backends on real-time factor and WER.")
+    parser.add_argument("clips_dir", help="folder of .wav clips with optional same-name .txt references")
+    parser.add_argument("--model", default="base")
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS))
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    clips = load_clips(args.clips_dir)
+    if not clips:
+        sys.exit(f"No .wav clips found in {args.clips_dir}")
+
+    report = {"clips_dir": args.clips_dir, "backends": []}
+    for backend_name in args.backends:
+        try:
+            report["backends"].append(benchmark_backend(backend_name, args.model, clips))
+        except Exception as e:
+            report["backends"].append({"backend": backend_name, "model": args.model, "error": str(e)})
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
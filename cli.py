@@ -0,0 +1,248 @@
+# cli.py
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".flac", ".ogg")
+
+_worker = {}
+
+
+def find_audio_files(inputs):
+    files = []
+    for item in inputs:
+        if os.path.isdir(item):
+            candidates = [os.path.join(item, name) for name in sorted(os.listdir(item))]
+        else:
+            candidates = sorted(glob.glob(item)) or [item]
+        files.extend(
+            os.path.abspath(path) for path in candidates
+            if os.path.isfile(path) and path.lower().endswith(AUDIO_EXTENSIONS)
+        )
+    return list(dict.fromkeys(files))
+
+
+def init_worker(options):
+    from translation import Translator
+    from translation_backends import get_backend as get_translation_backend
+    from translation_cache import TranslationCache
+
+    _worker["options"] = options
+    if options["engine"] == "whisper":
+        from whisper_backends import get_backend
+        backend = get_backend(options["backend"], cpu_threads=options["threads_per_worker"])
+        _worker["model"] = backend.load(options["model"])
+    else:
+        from model_registry import get_registry
+        _worker["vosk_model"] = get_registry().get_model(options["language"], options["size"])
+    _worker["translator"] = None
+    if options["target"]:
+        backend = get_translation_backend(options["translation_backend"], source=options["source"])
+        # memory only: worker processes each opening the sqlite cache would race on its writes and eviction
+        _worker["translator"] = Translator(cache=TranslationCache(path=None), backend=backend)
+
+
+def transcribe_with_vosk(audio):
+    from vosk import KaldiRecognizer
+    recognizer = KaldiRecognizer(_worker["vosk_model"], 16000)
+    recognizer.SetWords(True)
+    pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+
+    results = []
+    chunk_size = 8000  # bytes, 250 ms
+    for offset in range(0, len(pcm), chunk_size):
+        if recognizer.AcceptWaveform(pcm[offset:offset + chunk_size]):
+            results.append(json.loads(recognizer.Result()))
+    results.append(json.loads(recognizer.FinalResult()))
+
+    segments = []
+    for result in results:
+        words = result.get("result") or []
+        if result.get("text") and words:
+            segments.append({"start": words[0]["start"], "end": words[-1]["end"], "text": result["text"]})
+    return segments
+
+
+def process_file(file_path):
+    from whisper_stream import load_audio
+
+    options = _worker["options"]
+    started = time.perf_counter()
+    audio = load_audio(file_path)
+    audio_seconds = len(audio) / 16000
+
+    if options["engine"] == "whisper":
+        result = _worker["model"].transcribe(audio)
+        segments = [
+            {"start": float(segment["start"]), "end": float(segment["end"]), "text": segment["text"].strip()}
+            for segment in result["segments"]
+        ]
+    else:
+        segments = transcribe_with_vosk(audio)
+    transcribed = time.perf_counter()
+
+    if _worker["translator"] is not None and segments:
+        translations = _worker["translator"].translate_batch([segment["text"] for segment in segments], options["target"])
+        for segment, translation in zip(segments, translations):
+            segment["translation"] = translation
+    finished = time.perf_counter()
+
+    return {
+        "file": file_path,
+        "engine": options["engine"],
+        "text": " ".join(segment["text"] for segment in segments),
+        "translation": " ".join(segment.get("translation") or "" for segment in segments).strip() or None,
+        "target": options["target"],
+        "segments": segments,
+        "timing": {
+            "audio_seconds": audio_seconds,
+            "transcribe_seconds": transcribed - started,
+            "translate_seconds": finished - transcribed,
+            "total_seconds": finished - started,
+            "rtf": (transcribed - started) / audio_seconds if audio_seconds else None
+        }
+    }
+
+
+def format_srt_timestamp(seconds):
+    milliseconds = int(round(seconds * 1000))
+    hours, milliseconds = divmod(milliseconds, 3600000)
+    minutes, milliseconds = divmod(milliseconds, 60000)
+    seconds, milliseconds = divmod(milliseconds, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+
+
+def write_srt(path, segments):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for index, segment in enumerate(segments, 1):
+            text = segment.get("translation") or segment["text"]
+            f.write(f"{index}\n")
+            f.write(f"{format_srt_timestamp(segment['start'])} --> {format_srt_timestamp(segment['end'])}\n")
+            f.write(f"{text}\n\n")
+
+
+def common_root(files):
+    try:
+        return os.path.commonpath([os.path.dirname(path) for path in files])
+    except ValueError:
+        # no shared folder, e.g. files on different Windows drives
+        return None
+
+
+def srt_path(output_dir, file_path, root):
+    # mirror the input tree so a/x.wav and b/x.wav do not write the same file
+    if root is None:
+        relative = os.path.splitdrive(file_path)[1].lstrip("\\/")
+    else:
+        relative = os.path.relpath(file_path, root)
+    return os.path.join(output_dir, os.path.splitext(relative)[0] + ".srt")
+
+
+def load_processed(output_path):
+    processed = set()
+    if not os.path.exists(output_path):
+        return processed
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if "error" not in record:
+                processed.add(record["file"])
+    return processed
+
+
+def parse_args(argv=None):
+    from whisper_backends import BACKENDS, DEFAULT_BACKEND
+    import translation_backends
+    from model import voskModels
+
+    parser = argparse.ArgumentParser(description="Transcribe and translate folders of audio files.")
+    parser.add_argument("inputs", nargs="+", help="audio files, folders or glob patterns")
+    parser.add_argument("--engine", choices=["whisper", "vosk"], default="whisper")
+    parser.add_argument("--model", default="base", help="Whisper model size")
+    parser.add_argument("--backend", choices=list(BACKENDS), default=DEFAULT_BACKEND)
+    parser.add_argument("--language", choices=list(voskModels), default="English", help="Vosk model language")
+    parser.add_argument("--size", choices=["small", "large"], default="small", help="Vosk model size")
+    parser.add_argument("--target", help="translate to this language code, e.g. 'es'")
+    parser.add_argument("--translation-backend", choices=list(translation_backends.BACKENDS),
+                        default=translation_backends.DEFAULT_BACKEND)
+    parser.add_argument("--source", default="auto", help="spoken language code; local translation models need one, e.g. 'en'")
+    parser.add_argument("--format", choices=["jsonl", "srt"], default="jsonl")
+    parser.add_argument("--output", default="transcripts.jsonl", help="JSONL file, or folder for SRT files")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--no-resume", action="store_true", help="reprocess files that already have output")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    files = find_audio_files(args.inputs)
+    root = common_root(files) if files else None
+    if args.format == "srt":
+        os.makedirs(args.output, exist_ok=True)
+
+    if not args.no_resume:
+        if args.format == "jsonl":
+            processed = load_processed(args.output)
+            files = [path for path in files if path not in processed]
+        else:
+            files = [path for path in files if not os.path.exists(srt_path(args.output, path, root))]
+    if not files:
+        print("Nothing to do.", file=sys.stderr)
+        return 0
+
+    workers = max(1, min(args.workers, len(files)))
+    options = {
+        "engine": args.engine,
+        "model": args.model,
+        "backend": args.backend,
+        "language": args.language,
+        "size": args.size,
+        "target": args.target,
+        "translation_backend": args.translation_backend,
+        "source": args.source,
+        "threads_per_worker": max(1, (os.cpu_count() or 1) // workers)
+    }
+
+    failures = 0
+    started = time.perf_counter()
+    jsonl = open(args.output, "a", encoding="utf-8") if args.format == "jsonl" else None
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(options,)) as executor:
+            futures = {executor.submit(process_file, path): path for path in files}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    record = future.result()
+                except Exception as e:
+                    failures += 1
+                    record = {"file": path, "error": str(e)}
+                    print(f"{path}: failed: {e}", file=sys.stderr)
+                else:
+                    timing = record["timing"]
+                    print(f"{path}: {timing['total_seconds']:.1f}s for {timing['audio_seconds']:.1f}s of audio", file=sys.stderr)
+                    if args.format == "srt":
+                        write_srt(srt_path(args.output, path, root), record["segments"])
+
+                if jsonl is not None:
+                    jsonl.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    jsonl.flush()
+    finally:
+        if jsonl is not None:
+            jsonl.close()
+
+    print(f"Processed {len(files)} files with {workers} workers in {time.perf_counter() - started:.1f}s "
+          f"({failures} failed).", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
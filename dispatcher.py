@@ -0,0 +1,27 @@
+# dispatcher.py
+import queue
+
+
+class TkDispatcher:
+    def __init__(self, root, interval=50):
+        self.root = root
+        self.interval = interval  # milliseconds
+        self.pending = queue.Queue()
+        self.root.after(self.interval, self.drain)
+
+    def post(self, func, *args):
+        self.pending.put((func, args))
+
+    def wrap(self, func):
+        return lambda *args: self.post(func, *args)
+
+    def drain(self):
+        try:
+            while True:
+                try:
+                    func, args = self.pending.get_nowait()
+                except queue.Empty:
+                    break
+                func(*args)
+        finally:
+            self.root.after(self.interval, self.drain)
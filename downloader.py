@@ -0,0 +1,156 @@
+# downloader.py
+import hashlib
+import json
+import os
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from http_client import HttpClient
+
+DOWNLOAD_TIMEOUT = (5, 60)  # connect, read seconds
+
+
+class DownloadError(Exception):
+    pass
+
+
+class ModelDownloader:
+    def __init__(self, client=None, parallel=4, part_size=32 * 1024 * 1024,
+                 chunk_size=1024 * 1024, on_progress=None):
+        self.parallel = max(1, parallel)
+        self.part_size = part_size
+        self.chunk_size = chunk_size
+        self.on_progress = on_progress
+        self.client = client or HttpClient(
+            pool_size=self.parallel,
+            max_concurrency=self.parallel,
+            timeout=DOWNLOAD_TIMEOUT
+        )
+        self.lock = threading.Lock()
+        self.downloaded = 0
+        self.total = None
+
+    def download(self, url, dest_path, expected_size=None, sha256=None):
+        part_path = f"{dest_path}.part"
+        total, accepts_ranges = self.probe(url)
+        if expected_size is not None and total is not None and total != expected_size:
+            raise DownloadError(f"Server reports {total} bytes, expected {expected_size}.")
+        self.total = total or expected_size
+
+        if self.total and accepts_ranges and self.parallel > 1 and self.total > self.part_size:
+            self.download_parallel(url, part_path)
+        else:
+            self.download_sequential(url, part_path, accepts_ranges)
+
+        self.verify(part_path, self.total, sha256)
+        os.replace(part_path, dest_path)
+        return dest_path
+
+    def probe(self, url):
+        response = self.client.request("HEAD", url, allow_redirects=True)
+        if response.status_code >= 400:
+            return None, False
+        length = response.headers.get("content-length")
+        accepts_ranges = response.headers.get("accept-ranges", "").lower() == "bytes"
+        return (int(length) if length else None), accepts_ranges
+
+    def report(self, count):
+        with self.lock:
+            self.downloaded += count
+            downloaded = self.downloaded
+        if self.on_progress:
+            self.on_progress(downloaded, self.total)
+
+    def download_sequential(self, url, part_path, accepts_ranges):
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        if self.total is not None and offset > self.total:
+            offset = 0
+        if self.total is not None and offset == self.total and accepts_ranges:
+            self.report(0)
+            return
+        headers = {}
+        if offset and accepts_ranges:
+            headers["Range"] = f"bytes={offset}-"
+        else:
+            offset = 0
+
+        with self.client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 200:
+                offset = 0
+            elif response.status_code != 206:
+                raise DownloadError(f"Download failed with HTTP {response.status_code}.")
+
+            self.downloaded = offset
+            with open(part_path, "r+b" if offset else "wb") as f:
+                f.seek(offset)
+                f.truncate()
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    if chunk:
+                        f.write(chunk)
+                        self.report(len(chunk))
+
+    def download_parallel(self, url, part_path):
+        state_path = f"{part_path}.json"
+        ranges = [
+            (start, min(start + self.part_size, self.total) - 1)
+            for start in range(0, self.total, self.part_size)
+        ]
+        done = set()
+        if os.path.exists(part_path) and os.path.getsize(part_path) == self.total and os.path.exists(state_path):
+            with open(state_path) as f:
+                state = json.load(f)
+            if state.get("total") == self.total and state.get("part_size") == self.part_size:
+                done = set(state.get("done", []))
+        else:
+            with open(part_path, "wb") as f:
+                f.truncate(self.total)
+
+        self.downloaded = sum(end - start + 1 for start, end in ranges if start in done)
+
+        def fetch(byte_range):
+            start, end = byte_range
+            headers = {"Range": f"bytes={start}-{end}"}
+            with self.client.stream("GET", url, headers=headers) as response:
+                if response.status_code != 206:
+                    raise DownloadError(f"Range request failed with HTTP {response.status_code}.")
+                position = start
+                with open(part_path, "r+b") as f:
+                    f.seek(start)
+                    for chunk in response.iter_content(chunk_size=self.chunk_size):
+                        if chunk:
+                            f.write(chunk)
+                            position += len(chunk)
+                            self.report(len(chunk))
+                if position != end + 1:
+                    raise DownloadError(f"Range {start}-{end} ended early at byte {position}.")
+
+            with self.lock:
+                done.add(start)
+                with open(state_path, "w") as f:
+                    json.dump({"total": self.total, "part_size": self.part_size, "done": sorted(done)}, f)
+
+        pending = [byte_range for byte_range in ranges if byte_range[0] not in done]
+        with ThreadPoolExecutor(max_workers=self.parallel) as executor:
+            for future in [executor.submit(fetch, byte_range) for byte_range in pending]:
+                future.result()
+
+        if os.path.exists(state_path):
+            os.remove(state_path)
+
+    def verify(self, part_path, total, sha256):
+        size = os.path.getsize(part_path)
+        if total is not None and size != total:
+            raise DownloadError(f"Downloaded {size} bytes, expected {total}.")
+        if sha256:
+            digest = hashlib.sha256()
+            with open(part_path, "rb") as f:
+                for block in iter(lambda: f.read(self.chunk_size), b""):
+                    digest.update(block)
+            if digest.hexdigest() != sha256.lower():
+                os.remove(part_path)
+                raise DownloadError("Checksum mismatch; the partial download was discarded.")
+
+
+def extract_archive(archive_path, dest_dir):
+    with zipfile.ZipFile(archive_path) as zip_ref:
+        zip_ref.extractall(dest_dir)
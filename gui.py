@@ -1,18 +1,30 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import threading
+import queue
 from model_handler import ModelHandler
 from transcription import TranscriptionManager
 from audio_handler import AudioHandler
 import os
-from deep_translator import GoogleTranslator
-import requests
-import soundfile as sf
-import sounddevice as sd
+from translation import Translator, get_google_translate_languages, parse_targets
+from model import voskLanguageCodes
+import translation_backends
+from translation_cache import TranslationCache
+from tts_cache import AudioCache
+from tts import ElevenLabsTTS, PCM_SAMPLE_RATE
+from playback import StreamPlayer
+from concurrent.futures import ThreadPoolExecutor
+from pipeline import SpeechPipeline, FanOutTarget
+from dispatcher import TkDispatcher
+from session_store import SessionStore
+from audio_grid import AudioGrid
+from text_renderer import TextRenderer
+from latency import LatencyTracker
+from latency_view import LatencyWindow
 import ttkbootstrap as ttk
 
 class TranscriptionApp:
-    def __init__(self, parent, root):
+    def __init__(self, parent, root, session=None, translation_cache=None, audio_cache=None):
         self.parent = parent
         self.root = root
 
@@ -30,14 +42,33 @@ class TranscriptionApp:
 
         self.translation_language_var = tk.StringVar(value="English")
         self.translation_languages = self.get_google_translate_languages()
+        self.broadcast_languages_var = tk.StringVar()
+        self.translation_backend_var = tk.StringVar(value=translation_backends.DEFAULT_BACKEND)
+        # one cache per process; separate instances on the same file would each count only their own entries
+        self.translator = Translator(cache=translation_cache or TranslationCache())
+        self.audio_cache = audio_cache or AudioCache()
+        self.latency_var = tk.StringVar(value="Latency: -")
+        self.latency = LatencyTracker(log_path=os.path.join("logs", "latency.jsonl"))
+
+        self.dispatcher = TkDispatcher(self.root)
+        self.stream_player = StreamPlayer(PCM_SAMPLE_RATE, on_error=self.dispatcher.wrap(self.playback_failed))
+        self.file_writer = ThreadPoolExecutor(max_workers=1)
+        self.pipeline = SpeechPipeline(
+            translator=self.translator,
+            on_event=self.dispatcher.wrap(self.handle_pipeline_event),
+            on_error=self.dispatcher.wrap(self.handle_pipeline_error),
+            latency=self.latency,
+            maxsize=32
+        )
+        self.pipeline.start()
 
         self.elevenlabs_api_key = tk.StringVar()
         self.elevenlabs_voice_id = tk.StringVar()
-        self.audio_files = []
+        # both tabs share one store so clip offsets into the audio archive stay consistent
+        self.session = session or SessionStore()
+        self.scrollback_lines = 1000
 
         self.sequential_playback_active = False
-        self.sequential_playback_thread = None
-        self.stop_sequential_playback = threading.Event()
 
         self.progress_var = tk.DoubleVar()
         self.progress_bar = ttk.Progressbar(self.parent, variable=self.progress_var, maximum=100)
@@ -45,6 +76,8 @@ class TranscriptionApp:
         self.progress_bar.grid_remove()
 
         self.setup_gui()
+        self.restore_history()
+        self.model_handler.preload_models([(self.language_var.get(), self.size_var.get())])
 
     def show_progress_bar(self):
         self.progress_bar.grid()
@@ -100,6 +133,7 @@ class TranscriptionApp:
         self.language_combo = ttk.Combobox(self.parent, textvariable=self.language_var, state="readonly")
         self.language_combo['values'] = list(self.model_handler.vosk_models.keys())
         self.language_combo.grid(column=1, row=2, padx=5, pady=2, sticky='w')
+        self.language_combo.bind("<<ComboboxSelected>>", self.update_language)
 
         size_label = ttk.Label(self.parent, text="Select Model Size:")
         size_label.grid(column=0, row=3, padx=5, pady=2, sticky='w')
@@ -122,6 +156,10 @@ class TranscriptionApp:
         clear_transcription_button.grid(column=2, row=4, padx=5, pady=2, sticky='w')
 
         self.transcription_area = scrolledtext.ScrolledText(self.parent, wrap=tk.WORD, state='disabled')
+        self.transcription_renderer = TextRenderer(
+            self.root, self.transcription_area, self.dispatcher, max_lines=self.scrollback_lines,
+            on_trim=lambda lines: self.session.archive_lines("vosk", "transcription", lines)
+        )
         self.transcription_area.grid(column=0, row=5, columnspan=3, padx=10, pady=5, sticky='nsew')
 
     def update_model_sizes(self, event=None):
@@ -132,6 +170,12 @@ class TranscriptionApp:
             if model_sizes:
                 self.size_var.set(model_sizes[0])
 
+    def update_language(self, event=None):
+        self.update_model_sizes()
+        # a local translation model is tied to the spoken language
+        if self.translation_backend_var.get() != translation_backends.DEFAULT_BACKEND:
+            self.update_translation_backend()
+
     def setup_translation_section(self):
         translation_label = ttk.Label(self.parent, text="Translation Controls", font=("Helvetica", 14, "bold"))
         translation_label.grid(column=3, row=1, columnspan=3, padx=10, pady=5, sticky='nsew')
@@ -146,9 +190,31 @@ class TranscriptionApp:
         clear_translation_button = ttk.Button(self.parent, text="Clear Translation", command=self.clear_translation)
         clear_translation_button.grid(column=5, row=2, padx=10, pady=2, sticky='w')
 
+        broadcast_label = ttk.Label(self.parent, text="Also Translate To:")
+        broadcast_label.grid(column=3, row=3, padx=10, pady=2, sticky='w')
+
+        # comma separated languages, each optionally followed by :voice_id
+        self.broadcast_entry = ttk.Entry(self.parent, textvariable=self.broadcast_languages_var, width=30)
+        self.broadcast_entry.grid(column=4, row=3, columnspan=2, padx=10, pady=2, sticky='w')
+
+        translation_backend_label = ttk.Label(self.parent, text="Translation Engine:")
+        translation_backend_label.grid(column=3, row=4, padx=10, pady=2, sticky='w')
+
+        self.translation_backend_combo = ttk.Combobox(self.parent, textvariable=self.translation_backend_var, state="readonly")
+        self.translation_backend_combo['values'] = list(translation_backends.BACKENDS.keys())
+        self.translation_backend_combo.grid(column=4, row=4, padx=10, pady=2, sticky='w')
+        self.translation_backend_combo.bind("<<ComboboxSelected>>", self.update_translation_backend)
+
         self.translation_area = scrolledtext.ScrolledText(self.parent, wrap=tk.WORD, state='disabled')
+        self.translation_renderer = TextRenderer(
+            self.root, self.translation_area, self.dispatcher, max_lines=self.scrollback_lines,
+            on_trim=lambda lines: self.session.archive_lines("vosk", "translation", lines)
+        )
         self.translation_area.grid(column=3, row=5, columnspan=3, padx=10, pady=5, sticky='nsew')
 
+        latency_label = ttk.Label(self.parent, textvariable=self.latency_var)
+        latency_label.grid(column=3, row=6, columnspan=3, padx=10, pady=2, sticky='w')
+
     def setup_elevenlabs_section(self):
         elevenlabs_label = ttk.Label(self.parent, text="11labs Output", font=("Helvetica", 14, "bold"))
         elevenlabs_label.grid(column=6, row=1, columnspan=2, padx=10, pady=5, sticky='nsew')
@@ -165,15 +231,30 @@ class TranscriptionApp:
         self.voice_id_entry = ttk.Entry(self.parent, textvariable=self.elevenlabs_voice_id, width=30)
         self.voice_id_entry.grid(column=7, row=3, padx=10, pady=2, sticky='w')
 
-        self.audio_grid_frame = ttk.Frame(self.parent)
-        self.audio_grid_frame.grid(column=6, row=5, columnspan=2, padx=10, pady=5, sticky='nsew')
+        self.audio_grid = AudioGrid(
+            self.parent,
+            self.session,
+            "vosk",
+            on_play=self.play_audio_clip,
+            actions=[("X", self.delete_audio_clip)]
+        )
+        self.audio_grid.grid(column=6, row=5, columnspan=2, padx=10, pady=5, sticky='nsew')
+
+        playback_controls = ttk.Frame(self.parent)
+        playback_controls.grid(column=6, row=6, padx=10, pady=10, sticky='w')
 
         self.sequential_playback_button = ttk.Button(
-            self.parent,
+            playback_controls,
             text="Play All Sequentially (Off)",
             command=self.toggle_sequential_playback
         )
-        self.sequential_playback_button.grid(column=6, row=6, padx=10, pady=10, sticky='w')
+        self.sequential_playback_button.grid(column=0, row=0, sticky='w')
+
+        skip_button = ttk.Button(playback_controls, text="Skip", command=self.skip_playback)
+        skip_button.grid(column=1, row=0, padx=(5, 0), sticky='w')
+
+        latency_button = ttk.Button(self.parent, text="Latency Stats", command=self.show_latency_window)
+        latency_button.grid(column=7, row=6, padx=10, pady=10, sticky='w')
 
     def setup_bottom_section(self):
         mic_test_label = ttk.Label(self.parent, text="Microphone Test", font=("Helvetica", 14, "bold"))
@@ -192,8 +273,7 @@ class TranscriptionApp:
         progress_label.grid(column=0, row=9, columnspan=8, padx=10, pady=10, sticky='nsew')
 
     def get_google_translate_languages(self):
-        languages = GoogleTranslator().get_supported_languages(as_dict=True)
-        return {lang.capitalize(): code for lang, code in languages.items()}
+        return get_google_translate_languages()
 
     def load_model(self):
         self.model_handler.load_model()
@@ -205,139 +285,192 @@ class TranscriptionApp:
         self.transcription_manager.stop_transcription()
 
     def clear_transcription(self):
-        self.transcription_area.configure(state='normal')
-        self.transcription_area.delete('1.0', tk.END)
-        self.transcription_area.configure(state='disabled')
+        self.transcription_renderer.clear()
 
     def clear_translation(self):
-        self.translation_area.configure(state='normal')
-        self.translation_area.delete('1.0', tk.END)
-        self.translation_area.configure(state='disabled')
-
-    def update_transcription(self, text, final=False):
-        def append_text():
-            self.transcription_area.configure(state='normal')
-            if final:
-                self.transcription_area.insert(tk.END, f"{text}\n")
-                self.translate_text(text)
-            else:
-                self.transcription_area.delete("end-2l linestart", "end-1c")
-                self.transcription_area.insert(tk.END, f"{text}\n")
-            self.transcription_area.configure(state='disabled')
-            self.transcription_area.see(tk.END)
-
-        self.root.after(0, append_text)
-
-    def translate_text(self, text):
+        self.translation_renderer.clear()
+
+    def update_transcription(self, text, final=False, timestamps=None):
+        # bursts of partials collapse into one redraw per frame
+        if final:
+            self.transcription_renderer.append(text)
+            self.dispatcher.post(self.translate_text, text, timestamps)
+        else:
+            self.transcription_renderer.set_partial(text)
+
+    def restore_history(self):
+        # a broadcast utterance has one row per language but is shown as spoken once
+        spoken = set()
+        for text, translation, target, broadcast_id in self.session.recent_utterances("vosk", self.scrollback_lines):
+            if broadcast_id is None or broadcast_id not in spoken:
+                spoken.add(broadcast_id)
+                self.transcription_renderer.append(text)
+            if translation:
+                self.translation_renderer.append(self.format_translation(translation, target, broadcast_id))
+
+    def translate_text(self, text, timestamps=None):
+        selected_language_name = self.translation_language_var.get()
+        target_language = self.translation_languages.get(selected_language_name.capitalize(), "en")
+        self.pipeline.tts = self.get_elevenlabs_tts()
+        self.pipeline.targets = self.get_broadcast_targets(target_language)
+        try:
+            self.pipeline.submit_text(text, target_language, timeout=0, timestamps=timestamps)
+        except queue.Full:
+            messagebox.showwarning("Warning", "Translation is falling behind; the utterance was dropped.")
+
+    def update_translation_backend(self, event=None):
+        name = self.translation_backend_var.get()
+        source = "auto"
+        if name != translation_backends.DEFAULT_BACKEND:
+            # local models are trained per language pair, so they need the spoken language
+            source = voskLanguageCodes.get(self.language_var.get())
+            if source is None:
+                messagebox.showerror("Translation Error", f"The {name} engine has no language code for {self.language_var.get()}.")
+                name = translation_backends.DEFAULT_BACKEND
+                source = "auto"
+                self.translation_backend_var.set(name)
+        backend = translation_backends.get_backend(name, source=source)
+        self.translator.backend = backend
+        load = getattr(backend, "load", None)
+        if load is not None:
+            target = self.translation_languages.get(self.translation_language_var.get().capitalize(), "en")
+            threading.Thread(target=self.warm_translation_backend, args=(load, target), daemon=True).start()
+
+    def warm_translation_backend(self, load, target):
+        # load the model now so the first utterance does not pay for it
         try:
-            selected_language_name = self.translation_language_var.get()
-            target_language = self.translation_languages.get(selected_language_name.capitalize(), "en")
-            translator = GoogleTranslator(source='auto', target=target_language)
-            translated_text = translator.translate(text)
-            self.translation_area.configure(state='normal')
-            self.translation_area.insert(tk.END, f"{translated_text}\n")
-            self.translation_area.configure(state='disabled')
-            self.translation_area.see(tk.END)
-            self.generate_elevenlabs_audio(translated_text)
+            load(target)
         except Exception as e:
-            messagebox.showerror("Translation Error", f"An error occurred during translation: {e}")
+            self.dispatcher.post(messagebox.showerror, "Translation Error", f"Failed to load the translation model: {e}")
 
-    def generate_elevenlabs_audio(self, text):
+    def get_elevenlabs_tts(self):
         api_key = self.elevenlabs_api_key.get()
         voice_id = self.elevenlabs_voice_id.get()
 
         if not api_key or not voice_id:
             messagebox.showwarning("Warning", "Please enter your 11labs API key and voice ID.")
-            return
-
-        url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
-        headers = {
-            "Accept": "audio/mpeg",
-            "Content-Type": "application/json",
-            "xi-api-key": api_key
-        }
-        data = {
-            "text": text,
-            "voice_settings": {
-                "stability": 0.5,
-                "similarity_boost": 0.5
-            }
-        }
-
-        try:
-            response = requests.post(url, json=data, headers=headers)
-            if response.status_code == 200:
-                audio_file = f"output_{len(self.audio_files) + 1}.mp3"
-                with open(audio_file, "wb") as f:
-                    f.write(response.content)
-                self.audio_files.append(audio_file)
-                self.update_audio_grid()
-
-                if self.sequential_playback_active:
-                    self.play_audio_file(audio_file)
-            else:
-                messagebox.showerror("Error", f"Failed to generate audio: {response.text}")
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred while generating audio: {e}")
-
-    def update_audio_grid(self):
-        for widget in self.audio_grid_frame.winfo_children():
-            widget.destroy()
+            return None
+        return ElevenLabsTTS(api_key, voice_id, cache=self.audio_cache)
+
+    def get_broadcast_targets(self, target_language):
+        # every extra language is translated and voiced alongside the selected one
+        extra = parse_targets(self.broadcast_languages_var.get(), self.translation_languages)
+        if not extra:
+            return None
+        api_key = self.elevenlabs_api_key.get()
+        targets = [FanOutTarget(target_language, self.pipeline.tts, self.pipeline.player)]
+        for language, voice_id in extra:
+            if language == target_language:
+                continue
+            voice_id = voice_id or self.elevenlabs_voice_id.get()
+            tts = ElevenLabsTTS(api_key, voice_id, cache=self.audio_cache) if api_key and voice_id else None
+            targets.append(FanOutTarget(language, tts))
+        return targets
+
+    def handle_pipeline_event(self, event, utterance):
+        if event == "translated":
+            self.show_translation(utterance)
+        elif event == "synthesized":
+            self.add_generated_audio(utterance)
+
+    def handle_pipeline_error(self, stage, item, error):
+        if stage == "translate":
+            messagebox.showerror("Translation Error", f"An error occurred during translation: {error}")
+        else:
+            messagebox.showerror("Error", f"An error occurred while generating audio: {error}")
 
-        for i, audio_file in enumerate(self.audio_files):
-            audio_frame = ttk.Frame(self.audio_grid_frame)
-            audio_frame.grid(row=i // 2, column=i % 2, padx=5, pady=5, sticky='nsew')
+    def show_translation(self, utterance):
+        utterance.record_id = self.session.record_utterance("vosk", utterance)
+        self.translation_renderer.append(
+            self.format_translation(utterance.translation, utterance.target, utterance.broadcast_id)
+        )
+        self.update_latency_label(utterance)
 
-            play_button = ttk.Button(audio_frame, text=f"Play {i + 1}", command=lambda f=audio_file: self.play_audio_file(f))
-            play_button.grid(row=0, column=0, padx=5, pady=5, sticky='nsew')
+    def format_translation(self, translation, target, broadcast_id):
+        if broadcast_id is None:
+            return translation
+        return f"[{target}] {translation}"
 
-            delete_button = ttk.Button(audio_frame, text="X", command=lambda f=audio_file: self.delete_audio_file(f))
-            delete_button.grid(row=0, column=1, padx=5, pady=5, sticky='nsew')
+    def add_generated_audio(self, utterance):
+        future = self.file_writer.submit(self.session.add_clip, "vosk", utterance.audio, utterance.sample_rate, utterance)
+        future.add_done_callback(lambda f: self.dispatcher.post(self.audio_clip_saved, utterance, f))
+        self.update_latency_label(utterance)
 
-    def delete_audio_file(self, file_path):
+    def audio_clip_saved(self, utterance, future):
         try:
-            os.remove(file_path)
-            self.audio_files.remove(file_path)
-            self.update_audio_grid()
+            clip_id = future.result()
         except Exception as e:
-            messagebox.showerror("Error", f"An error occurred while deleting the audio file: {e}")
+            messagebox.showerror("Error", f"An error occurred while saving the generated audio: {e}")
+            return
 
-    def play_audio_file(self, file_path):
+        self.audio_grid.add(clip_id, utterance.target)
+        if self.sequential_playback_active and not utterance.played and utterance.broadcast_id is None:
+            self.stream_player.play_file(
+                self.session.clip_source(clip_id),
+                on_start=lambda: self.pipeline.playback_started(utterance)
+            )
+
+    def update_latency_label(self, utterance):
+        parts = []
+        translate_latency = utterance.latency("asr_final", "translated")
+        if translate_latency is not None:
+            parts.append(f"translate {translate_latency:.2f}s")
+        first_audio_latency = utterance.latency("translated", "tts_first_byte")
+        if first_audio_latency is not None:
+            parts.append(f"first audio {first_audio_latency:.2f}s")
+        tts_latency = utterance.latency("translated", "tts_complete")
+        if tts_latency is not None:
+            parts.append(f"11labs {tts_latency:.2f}s")
+        total_latency = utterance.latency("asr_final", "tts_complete")
+        if total_latency is not None:
+            parts.append(f"total {total_latency:.2f}s")
+        end_to_end = self.latency.summary()["end_to_end"]
+        if end_to_end["count"]:
+            parts.append(f"p95 end-to-end {end_to_end['p95']:.2f}s")
+        cache_stats = self.translator.cache.stats()
+        lookups = cache_stats["hits"] + cache_stats["misses"]
+        if lookups:
+            parts.append(f"cache hits {cache_stats['hits']}/{lookups}")
+        audio_cache_stats = self.audio_cache.stats()
+        audio_lookups = audio_cache_stats["hits"] + audio_cache_stats["misses"]
+        if audio_lookups:
+            parts.append(f"11labs cache hits {audio_cache_stats['hits']}/{audio_lookups}")
+        self.latency_var.set("Latency: " + " | ".join(parts))
+
+    def show_latency_window(self):
+        LatencyWindow(self.root, self.latency)
+
+    def delete_audio_clip(self, clip_id):
         try:
-            data, fs = sf.read(file_path, dtype='int16')
-            sd.play(data, fs)
-            sd.wait()
+            self.session.remove_clip(clip_id)
+            self.audio_grid.remove(clip_id)
         except Exception as e:
-            messagebox.showerror("Error", f"An error occurred during playback: {e}")
+            messagebox.showerror("Error", f"An error occurred while deleting the audio file: {e}")
+
+    def play_audio_clip(self, clip_id):
+        # a clicked clip replaces whatever is playing or queued
+        self.stream_player.cancel()
+        self.stream_player.play_file(self.session.clip_source(clip_id))
+
+    def playback_failed(self, source, error):
+        messagebox.showerror("Error", f"An error occurred during playback: {error}")
+
+    def skip_playback(self):
+        self.stream_player.skip()
 
     def toggle_sequential_playback(self):
         if self.sequential_playback_active:
             self.sequential_playback_active = False
-            self.stop_sequential_playback.set()
+            self.pipeline.player = None
+            self.stream_player.cancel()
             self.sequential_playback_button.config(text="Play All Sequentially (Off)")
         else:
             self.sequential_playback_active = True
-            self.stop_sequential_playback.clear()
+            self.pipeline.player = self.stream_player
             self.sequential_playback_button.config(text="Play All Sequentially (On)")
-
-            if self.audio_files:
-                self.play_all_sequentially()
+            self.play_all_sequentially()
 
     def play_all_sequentially(self):
-        if not self.sequential_playback_active:
-            return
-
-        def play_next(index):
-            if index < len(self.audio_files) and self.sequential_playback_active:
-                file_path = self.audio_files[index]
-                try:
-                    data, fs = sf.read(file_path, dtype='int16')
-                    sd.play(data, fs)
-                    sd.wait()
-                    self.root.after(0, lambda: play_next(index + 1))
-                except Exception as e:
-                    messagebox.showerror("Error", f"An error occurred during playback: {e}")
-            elif index >= len(self.audio_files):
-                self.root.after(1000, lambda: play_next(index))
-
-        play_next(0)
\ No newline at end of file
+        # queued back to back on the one output stream; new clips stream in as they are synthesized
+        for clip_id in self.session.clip_ids("vosk"):
+            self.stream_player.play_file(self.session.clip_source(clip_id))
\ No newline at end of file
@@ -0,0 +1,101 @@
+# http_client.py
+import contextlib
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_TIMEOUT = (5, 30)  # connect, read seconds
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+DEFAULT_REQUESTS_PER_SECOND = 10
+
+
+class RateLimiter:
+    def __init__(self, rate, burst=None):
+        self.rate = rate  # requests per second
+        self.burst = burst or max(1, int(rate))
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class HttpClient:
+    def __init__(self, pool_size=10, max_concurrency=4, timeout=DEFAULT_TIMEOUT,
+                 retries=3, backoff_factor=0.5, requests_per_second=None, burst=None):
+        self.timeout = timeout
+        self.slots = threading.BoundedSemaphore(max_concurrency)
+        # every caller sharing this client draws from the one request budget
+        self.limiter = RateLimiter(requests_per_second, burst) if requests_per_second else None
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            # only urllib3's default idempotent methods; a re-sent TTS POST would be generated and billed twice
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        if self.limiter is not None:
+            self.limiter.acquire()
+        with self.slots:
+            return self.session.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    @contextlib.contextmanager
+    def stream(self, method, url, **kwargs):
+        # the slot stays taken until the body has been consumed
+        kwargs.setdefault("timeout", self.timeout)
+        if self.limiter is not None:
+            self.limiter.acquire()
+        with self.slots:
+            response = self.session.request(method, url, stream=True, **kwargs)
+            try:
+                yield response
+            finally:
+                response.close()
+
+    def close(self):
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient(requests_per_second=DEFAULT_REQUESTS_PER_SECOND)
+        return _client
+
+
+def set_client(client):
+    global _client
+    with _client_lock:
+        _client = client
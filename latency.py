@@ -0,0 +1,93 @@
+# latency.py
+import json
+import os
+import threading
+import time
+from collections import deque
+
+STAGES = ["capture", "asr_final", "translated", "tts_first_byte", "tts_complete", "playback_start"]
+
+SPANS = {
+    "asr": ("capture", "asr_final"),
+    "translate": ("asr_final", "translated"),
+    "tts_first_byte": ("translated", "tts_first_byte"),
+    "tts_complete": ("translated", "tts_complete"),
+    "playback": ("tts_first_byte", "playback_start"),
+    "speech_to_audio": ("asr_final", "playback_start"),
+    "end_to_end": ("capture", "playback_start"),
+}
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class LatencyTracker:
+    def __init__(self, window=500, log_path=None):
+        self.window = window
+        self.log_path = log_path
+        self.samples = {span: deque(maxlen=window) for span in SPANS}
+        self.recent = deque(maxlen=window)
+        self.lock = threading.Lock()
+        self.log_file = None
+        if log_path:
+            os.makedirs(os.path.dirname(log_path) or ".", exist_ok=True)
+            self.log_file = open(log_path, "a", encoding="utf-8")
+
+    def observe(self, utterance, stage):
+        timestamps = utterance.timestamps
+        spans = {}
+        for span, (start, end) in SPANS.items():
+            if end == stage and start in timestamps:
+                spans[span] = timestamps[stage] - timestamps[start]
+
+        record = {
+            "utterance": utterance.id,
+            "stage": stage,
+            "monotonic": timestamps[stage],
+            "wall": time.time(),
+            "spans": spans
+        }
+        with self.lock:
+            for span, seconds in spans.items():
+                self.samples[span].append(seconds)
+            self.recent.append(record)
+            if self.log_file is not None:
+                self.log_file.write(json.dumps(record) + "\n")
+                self.log_file.flush()
+
+    def summary(self):
+        with self.lock:
+            samples = {span: list(values) for span, values in self.samples.items()}
+        return {
+            span: {
+                "count": len(values),
+                "p50": percentile(values, 0.50),
+                "p95": percentile(values, 0.95),
+                "p99": percentile(values, 0.99)
+            }
+            for span, values in samples.items()
+        }
+
+    def dump(self, path):
+        with self.lock:
+            recent = list(self.recent)
+        report = {
+            "generated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "window": self.window,
+            "spans": self.summary(),
+            "events": recent
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        return path
+
+    def close(self):
+        with self.lock:
+            if self.log_file is not None:
+                self.log_file.close()
+                self.log_file = None
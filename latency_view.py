@@ -0,0 +1,65 @@
+# latency_view.py
+import tkinter as tk
+from tkinter import messagebox, filedialog
+import time
+import ttkbootstrap as ttk
+from latency import SPANS
+
+COLUMNS = ("count", "p50", "p95", "p99")
+
+
+class LatencyWindow:
+    def __init__(self, root, tracker, refresh_ms=1000):
+        self.tracker = tracker
+        self.refresh_ms = refresh_ms
+        self.window = tk.Toplevel(root)
+        self.window.title("Latency")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        self.after_id = None
+
+        self.table = ttk.Treeview(self.window, columns=COLUMNS, height=len(SPANS))
+        self.table.heading("#0", text="Stage")
+        self.table.column("#0", width=140)
+        for column in COLUMNS:
+            self.table.heading(column, text=column if column == "count" else f"{column} (ms)")
+            self.table.column(column, width=80, anchor='e')
+        for span, (start, end) in SPANS.items():
+            self.table.insert("", tk.END, iid=span, text=span, values=("0", "-", "-", "-"))
+        self.table.grid(column=0, row=0, columnspan=2, padx=10, pady=10, sticky='nsew')
+
+        save_button = ttk.Button(self.window, text="Save JSON", command=self.save)
+        save_button.grid(column=0, row=1, padx=10, pady=10, sticky='w')
+
+        close_button = ttk.Button(self.window, text="Close", command=self.close)
+        close_button.grid(column=1, row=1, padx=10, pady=10, sticky='e')
+
+        self.refresh()
+
+    def refresh(self):
+        for span, stats in self.tracker.summary().items():
+            values = [str(stats["count"])]
+            for column in COLUMNS[1:]:
+                seconds = stats[column]
+                values.append("-" if seconds is None else f"{seconds * 1000:.0f}")
+            self.table.item(span, values=values)
+        self.after_id = self.window.after(self.refresh_ms, self.refresh)
+
+    def save(self):
+        path = filedialog.asksaveasfilename(
+            parent=self.window,
+            defaultextension=".json",
+            initialfile=f"latency_{time.strftime('%Y%m%d-%H%M%S')}.json",
+            filetypes=[("JSON", "*.json")]
+        )
+        if not path:
+            return
+        try:
+            self.tracker.dump(path)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save latency report: {e}", parent=self.window)
+
+    def close(self):
+        if self.after_id is not None:
+            self.window.after_cancel(self.after_id)
+            self.after_id = None
+        self.window.destroy()
@@ -4,6 +4,9 @@ import sys
 from tkinter import ttk
 from gui import TranscriptionApp
 from whisper_clone_gui import WhisperCloneApp
+from session_store import SessionStore
+from translation_cache import TranslationCache
+from tts_cache import AudioCache
 import ttkbootstrap as ttk
 
 class MainApplication:
@@ -16,16 +19,30 @@ class MainApplication:
 
         self.style = ttk.Style(theme="solar")
 
+        self.session = SessionStore()
+        self.translation_cache = TranslationCache()
+        self.audio_cache = AudioCache()
+
         self.notebook = ttk.Notebook(root)
         self.notebook.pack(fill="both", expand=True)
 
         self.gui_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.gui_tab, text="Realtime Voice to Translated Voice")
-        self.original_gui = TranscriptionApp(self.gui_tab, root)
+        self.original_gui = TranscriptionApp(
+            self.gui_tab, root, session=self.session, translation_cache=self.translation_cache, audio_cache=self.audio_cache
+        )
 
         self.whisper_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.whisper_tab, text="Prerecorded Voice to Translated Voice")
-        self.whisper_gui = WhisperCloneApp(self.whisper_tab, root)
+        self.whisper_gui = WhisperCloneApp(
+            self.whisper_tab, root, session=self.session, translation_cache=self.translation_cache, audio_cache=self.audio_cache
+        )
+        self.notebook.bind("<<NotebookTabChanged>>", self.tab_changed)
+
+    def tab_changed(self, event=None):
+        # the Whisper model loads the first time its tab is opened
+        if self.notebook.select() == str(self.whisper_tab):
+            self.whisper_gui.ensure_whisper_model()
 
 def main():
     root = ttk.Window(themename="solar")
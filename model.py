@@ -232,3 +232,30 @@ voskModels = {
         }
     },
 }
+
+# language codes of the models above, as the translation backends expect them
+voskLanguageCodes = {
+    "English": "en",
+    "Spanish": "es",
+    "French": "fr",
+    "German": "de",
+    "Indian English": "en",
+    "Chinese": "zh",
+    "Russian": "ru",
+    "Portuguese": "pt",
+    "Japanese": "ja",
+    "Italian": "it",
+    "Dutch": "nl",
+    "Greek": "el",
+    "Arabic": "ar",
+    "Vietnamese": "vi",
+    "Korean": "ko",
+    "Hindi": "hi",
+    "Farsi": "fa",
+    "Filipino": "tl",
+    "Czech": "cs",
+    "Polish": "pl",
+    "Swedish": "sv",
+    "Esperanto": "eo",
+    "Breton": "br",
+}
@@ -1,14 +1,13 @@
 # model_handler.py
 import os
 import threading
-import requests
-import zipfile
-import io
 import time
 from tkinter import messagebox
-from vosk import Model, KaldiRecognizer
+from vosk import KaldiRecognizer
 from utils import show_progress_bar, hide_progress_bar, update_progress_bar
 from model import voskModels
+from model_registry import get_registry
+from downloader import ModelDownloader, extract_archive
 
 class ModelHandler:
     def __init__(self, gui):
@@ -38,48 +37,34 @@ class ModelHandler:
                 f"The selected model '{model_name}' is not found in the 'models' folder.\nDo you want to download it now?"
             )
             if response:
-                self.download_thread = threading.Thread(target=self.download_and_extract_model, args=(model_url, model_name))
+                self.download_thread = threading.Thread(target=self.download_and_extract_model, args=(model_url, model_name, model_info.get('sha256')))
                 self.download_thread.start()
                 self.gui.root.after(100, self.check_download_thread)
             else:
                 return False
         else:
-            self.initialize_model(model_path)
+            self.initialize_model(language, size)
 
     def check_download_thread(self):
         if self.download_thread.is_alive():
             self.gui.root.after(100, self.check_download_thread)
         else:
-            if self.initialize_model(os.path.join("models", self.vosk_models[self.gui.language_var.get()][self.gui.size_var.get()]['name'])):
+            if self.initialize_model(self.gui.language_var.get(), self.gui.size_var.get()):
                 messagebox.showinfo("Success", "Model downloaded and loaded successfully.")
             else:
                 messagebox.showerror("Error", "Failed to load the model after downloading.")
 
-    def download_and_extract_model(self, url, model_name):
+    def download_and_extract_model(self, url, model_name, sha256=None):
         try:
             self.gui.show_progress_bar()
-            response = requests.get(url, stream=True)
-            total_length = response.headers.get('content-length')
+            models_dir = os.path.join("models")
+            os.makedirs(models_dir, exist_ok=True)
+            archive_path = os.path.join(models_dir, f"{model_name}.zip")
 
-            if total_length is None:
-                self.gui.hide_progress_bar()
-                messagebox.showerror("Error", "Failed to retrieve the model. No content-length header.")
-                return
-
-            total_length = int(total_length)
-            downloaded = 0
-            chunk_size = 1024 * 1024  # 1 MB
-            zip_content = io.BytesIO()
-
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                if chunk:
-                    zip_content.write(chunk)
-                    downloaded += len(chunk)
-                    percent = (downloaded / total_length) * 100
-                    self.gui.update_progress_bar(percent)
-
-            with zipfile.ZipFile(zip_content) as zip_ref:
-                zip_ref.extractall(os.path.join("models"))
+            downloader = ModelDownloader(on_progress=self.report_download_progress)
+            downloader.download(url, archive_path, sha256=sha256)
+            extract_archive(archive_path, models_dir)
+            os.remove(archive_path)
 
             self.gui.update_progress_bar(100)
             time.sleep(0.5)
@@ -88,12 +73,22 @@ class ModelHandler:
             self.gui.hide_progress_bar()
             messagebox.showerror("Download Error", f"An error occurred while downloading the model: {e}")
 
-    def initialize_model(self, model_path):
+    def report_download_progress(self, downloaded, total):
+        if total:
+            self.gui.update_progress_bar((downloaded / total) * 100)
+
+    def initialize_model(self, language, size):
         try:
-            self.model = Model(model_path)
-            self.recognizer = KaldiRecognizer(self.model, 16000)
+            self.model = get_registry().get_model(language, size)
+            self.recognizer = self.create_recognizer()
             messagebox.showinfo("Success", "Model loaded successfully.")
             return True
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load model: {e}")
             return False
+
+    def create_recognizer(self):
+        return KaldiRecognizer(self.model, 16000)
+
+    def preload_models(self, keys):
+        return get_registry().preload(keys)
@@ -0,0 +1,104 @@
+# model_registry.py
+import os
+import threading
+from collections import OrderedDict
+from vosk import Model, KaldiRecognizer
+from model import voskModels
+
+MODELS_DIR = "models"
+DEFAULT_MEMORY_BUDGET = 4 * 1024 * 1024 * 1024  # 4 GB
+
+
+def model_path(language, size, models_dir=MODELS_DIR):
+    return os.path.join(models_dir, voskModels[language][size]['name'])
+
+
+def estimate_model_bytes(path):
+    total = 0
+    for directory, _, files in os.walk(path):
+        for name in files:
+            total += os.path.getsize(os.path.join(directory, name))
+    return total
+
+
+class ModelRegistry:
+    def __init__(self, memory_budget=DEFAULT_MEMORY_BUDGET, models_dir=MODELS_DIR):
+        self.memory_budget = memory_budget
+        self.models_dir = models_dir
+        self.models = OrderedDict()
+        self.loading = {}
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+
+    def is_loaded(self, language, size):
+        with self.lock:
+            return (language, size) in self.models
+
+    def get_model(self, language, size):
+        key = (language, size)
+        while True:
+            with self.lock:
+                if key in self.models:
+                    self.models.move_to_end(key)
+                    return self.models[key][0]
+                event = self.loading.get(key)
+                if event is None:
+                    event = self.loading[key] = threading.Event()
+                    break
+            event.wait()
+
+        try:
+            path = model_path(language, size, self.models_dir)
+            model = Model(path)
+            model_bytes = estimate_model_bytes(path)
+            with self.lock:
+                self.models[key] = (model, model_bytes)
+                self.total_bytes += model_bytes
+                self.evict()
+            return model
+        finally:
+            with self.lock:
+                del self.loading[key]
+            event.set()
+
+    def recognizer(self, language, size, sample_rate=16000):
+        return KaldiRecognizer(self.get_model(language, size), sample_rate)
+
+    def evict(self):
+        # the most recently used model always stays, even if it alone exceeds the budget
+        while self.total_bytes > self.memory_budget and len(self.models) > 1:
+            _, (_, model_bytes) = self.models.popitem(last=False)
+            self.total_bytes -= model_bytes
+
+    def release(self, language, size):
+        with self.lock:
+            entry = self.models.pop((language, size), None)
+            if entry is not None:
+                self.total_bytes -= entry[1]
+
+    def preload(self, keys, on_error=None):
+        def run():
+            for language, size in keys:
+                if not os.path.exists(model_path(language, size, self.models_dir)):
+                    continue
+                try:
+                    self.get_model(language, size)
+                except Exception as e:
+                    if on_error:
+                        on_error(language, size, e)
+
+        thread = threading.Thread(target=run, name="model-preload", daemon=True)
+        thread.start()
+        return thread
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry():
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry()
+        return _registry
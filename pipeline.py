@@ -0,0 +1,368 @@
+# pipeline.py
+import itertools
+import queue
+import threading
+import time
+import uuid
+
+_STOP = object()
+_utterance_ids = itertools.count(1)
+
+
+class Utterance:
+    def __init__(self, text=None, target=None):
+        self.id = next(_utterance_ids)
+        self.text = text
+        self.target = target
+        self.start = None
+        self.end = None
+        self.translation = None
+        self.audio = None
+        self.sample_rate = None
+        self.played = False
+        self.record_id = None
+        self.broadcast_id = None
+        # pipeline settings as they were when this utterance entered it
+        self.targets = None
+        self.tts = None
+        self.player = None
+        self.timestamps = {"created": time.monotonic()}
+
+    def mark(self, stage):
+        self.timestamps[stage] = time.monotonic()
+
+    def latency(self, start, end):
+        if start not in self.timestamps or end not in self.timestamps:
+            return None
+        return self.timestamps[end] - self.timestamps[start]
+
+
+class FanOutTarget:
+    def __init__(self, language, tts=None, player=None):
+        self.language = language
+        self.tts = tts
+        self.player = player
+
+
+class PipelineStage:
+    def __init__(self, name, handler, maxsize=8, on_error=None):
+        self.name = name
+        self.handler = handler
+        self.inbox = queue.Queue(maxsize=maxsize)
+        self.downstream = None
+        self.on_error = on_error
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, name=f"pipeline-{self.name}", daemon=True)
+        self.thread.start()
+
+    def put(self, item, timeout=None):
+        self.inbox.put(item, timeout=timeout)
+
+    def join(self, timeout=None):
+        if self.thread:
+            self.thread.join(timeout)
+
+    def run(self):
+        while True:
+            item = self.inbox.get()
+            if item is _STOP:
+                self.forward(_STOP)
+                break
+            try:
+                result = self.handler(item)
+            except Exception as e:
+                if self.on_error:
+                    self.on_error(self.name, item, e)
+                continue
+            if result is not None:
+                self.forward(result)
+
+    def forward(self, item):
+        if self.downstream is not None:
+            self.downstream.put(item)
+
+
+class BatchingStage(PipelineStage):
+    def __init__(self, name, handler, maxsize=8, on_error=None, batch_size=8, batch_window=0.0):
+        super().__init__(name, handler, maxsize, on_error)
+        self.batch_size = batch_size
+        self.batch_window = batch_window  # seconds to wait for more items after the first
+
+    def run(self):
+        while True:
+            items = self.next_batch()
+            stopping = items[-1] is _STOP
+            if stopping:
+                items.pop()
+            if items:
+                self.process(items)
+            if stopping:
+                self.forward(_STOP)
+                break
+
+    def next_batch(self):
+        items = [self.inbox.get()]
+        deadline = time.monotonic() + self.batch_window
+        while items[-1] is not _STOP and len(items) < self.batch_size:
+            try:
+                items.append(self.inbox.get(timeout=max(deadline - time.monotonic(), 0)))
+            except queue.Empty:
+                break
+        return items
+
+    def process(self, items):
+        try:
+            results = self.handler(items)
+        except Exception as e:
+            if self.on_error:
+                self.on_error(self.name, items, e)
+            return
+        for result in results:
+            if result is not None:
+                self.forward(result)
+
+
+class SpeechPipeline:
+    def __init__(self, asr=None, translator=None, tts=None, target="en",
+                 on_event=None, on_error=None, maxsize=8, player=None,
+                 translate_batch_size=8, translate_window=0.0, latency=None, targets=None):
+        self.asr = asr
+        self.translator = translator
+        self.tts = tts
+        self.player = player
+        self.target = target
+        self.on_event = on_event
+        self.on_error = on_error
+        self.latency = latency
+        self.targets = targets  # FanOutTargets; when set, each utterance goes to all of them
+        self.captured_at = None
+
+        self.stages = [
+            PipelineStage("asr", self.recognize, maxsize, self.report_error),
+            BatchingStage("translate", self.translate_many, maxsize, self.report_error,
+                          translate_batch_size, translate_window),
+            PipelineStage("tts", self.synthesize, maxsize, self.report_error),
+        ]
+        for stage, downstream in zip(self.stages, self.stages[1:]):
+            stage.downstream = downstream
+        self.maxsize = maxsize
+        self.fanout = PipelineStage("fanout", self.fan_out, maxsize, self.report_error)
+        # one bounded stage per language keeps each language in order while languages run side by side;
+        # a language that falls behind blocks the fan-out, which in turn fills up and pushes back on callers
+        self.language_stages = {}
+        self.workers_lock = threading.Lock()
+        self.running = False
+
+    def start(self):
+        if self.running:
+            return
+        for stage in self.stages + [self.fanout]:
+            stage.start()
+        self.running = True
+
+    def stop(self, timeout=None):
+        if not self.running:
+            return
+        self.stages[0].put(_STOP)
+        for stage in self.stages:
+            stage.join(timeout)
+        # recognition may still hand utterances to the fan-out until it has stopped
+        self.fanout.put(_STOP)
+        self.fanout.join(timeout)
+        with self.workers_lock:
+            stages, self.language_stages = self.language_stages, {}
+        for stage in stages.values():
+            stage.put(_STOP)
+        for stage in stages.values():
+            stage.join(timeout)
+        self.running = False
+
+    def feed_audio(self, data, timeout=None, captured_at=None):
+        self.stages[0].put(_Audio(data, captured_at), timeout=timeout)
+
+    def flush_audio(self, timeout=None):
+        self.stages[0].put(_Flush(), timeout=timeout)
+
+    def submit_text(self, text, target=None, timeout=None, timestamps=None):
+        utterance = Utterance(text, target)
+        timestamps = timestamps or {}
+        if "capture" in timestamps:
+            self.mark(utterance, "capture", timestamps["capture"])
+        self.mark(utterance, "asr_final", timestamps.get("asr_final"))
+        self.emit("transcribed", utterance)
+        self.snapshot(utterance)
+        if utterance.targets:
+            self.fanout.put(utterance, timeout=timeout)
+        else:
+            self.stages[1].put(utterance, timeout=timeout)
+        return utterance
+
+    def emit(self, event, payload):
+        if self.on_event:
+            self.on_event(event, payload)
+
+    def report_error(self, stage, item, error):
+        if self.on_error:
+            self.on_error(stage, item, error)
+
+    def mark(self, utterance, stage, at=None):
+        if at is None:
+            utterance.mark(stage)
+        else:
+            utterance.timestamps[stage] = at
+        if self.latency is not None:
+            self.latency.observe(utterance, stage)
+
+    def recognize(self, data):
+        if isinstance(data, _Flush):
+            utterance = self.transcribed(self.asr.flush())
+            self.captured_at = None
+            return utterance
+
+        if self.captured_at is None:
+            self.captured_at = data.captured_at
+        stream = getattr(self.asr, "stream", None)
+        if stream is not None:
+            # every segment of one fed clip shares the clip's capture time
+            for segment in stream(data.audio):
+                utterance = self.transcribed(segment["text"], segment.get("start"), segment.get("end"))
+                if utterance is not None:
+                    self.stages[0].forward(utterance)
+            self.captured_at = None
+            return None
+
+        text = self.asr.process(data.audio, on_partial=lambda partial: self.emit("partial", partial))
+        utterance = self.transcribed(text)
+        if utterance is not None:
+            self.captured_at = None
+        return utterance
+
+    def transcribed(self, text, start=None, end=None):
+        if not text:
+            return None
+
+        utterance = Utterance(text)
+        utterance.start = start
+        utterance.end = end
+        if self.captured_at is not None:
+            self.mark(utterance, "capture", self.captured_at)
+        self.mark(utterance, "asr_final")
+        self.emit("transcribed", utterance)
+        self.snapshot(utterance)
+        if utterance.targets:
+            self.fanout.put(utterance)
+            return None
+        return utterance
+
+    def snapshot(self, utterance):
+        # the GUI swaps these between submissions; queued utterances keep the ones they were submitted with
+        utterance.targets = list(self.targets) if self.targets else None
+        utterance.tts = self.tts
+        utterance.player = self.player
+
+    def fan_out(self, utterance):
+        # utterance ids restart with the process; stored history needs an id that never repeats
+        broadcast_id = uuid.uuid4().hex
+        for target in utterance.targets:
+            branch = Utterance(utterance.text, target.language)
+            branch.broadcast_id = broadcast_id
+            branch.start = utterance.start
+            branch.end = utterance.end
+            branch.timestamps.update(utterance.timestamps)
+            self.language_stage(target.language).put((branch, target))
+        return None
+
+    def language_stage(self, language):
+        with self.workers_lock:
+            stage = self.language_stages.get(language)
+            if stage is None:
+                stage = PipelineStage(f"fanout-{language}", self.deliver, self.maxsize, self.report_error)
+                stage.start()
+                self.language_stages[language] = stage
+            return stage
+
+    def deliver(self, item):
+        utterance, target = item
+        try:
+            self.translate(utterance)
+        except Exception as e:
+            self.report_error("translate", utterance, e)
+            return
+        try:
+            self.speak(utterance, target.tts, target.player)
+        except Exception as e:
+            self.report_error("tts", utterance, e)
+
+    def translate(self, utterance):
+        if utterance.target is None:
+            utterance.target = self.target
+        if self.translator is None:
+            utterance.translation = utterance.text
+        else:
+            utterance.translation = self.translator.translate(utterance.text, utterance.target)
+        self.mark(utterance, "translated")
+        self.emit("translated", utterance)
+        return utterance
+
+    def translate_many(self, utterances):
+        translate_batch = getattr(self.translator, "translate_batch", None)
+        if translate_batch is None or len(utterances) == 1:
+            return [self.translate(utterance) for utterance in utterances]
+
+        by_target = {}
+        for utterance in utterances:
+            if utterance.target is None:
+                utterance.target = self.target
+            by_target.setdefault(utterance.target, []).append(utterance)
+
+        for target, group in by_target.items():
+            translations = translate_batch([utterance.text for utterance in group], target)
+            for utterance, translation in zip(group, translations):
+                utterance.translation = translation
+                self.mark(utterance, "translated")
+                self.emit("translated", utterance)
+        return utterances
+
+    def synthesize(self, utterance):
+        return self.speak(utterance, utterance.tts, utterance.player)
+
+    def speak(self, utterance, tts, player=None):
+        if tts is None or not utterance.translation:
+            return None
+        audio = bytearray()
+        try:
+            for chunk in tts.stream(utterance.translation):
+                if not audio:
+                    self.mark(utterance, "tts_first_byte")
+                    self.emit("first_audio", utterance)
+                    if player is not None:
+                        player.feed(chunk, on_start=lambda: self.playback_started(utterance))
+                elif player is not None:
+                    player.feed(chunk)
+                audio.extend(chunk)
+        finally:
+            if player is not None and audio:
+                player.end_stream()
+
+        utterance.audio = bytes(audio)
+        utterance.sample_rate = tts.sample_rate
+        utterance.played = player is not None
+        self.mark(utterance, "tts_complete")
+        self.emit("synthesized", utterance)
+        return None
+
+    def playback_started(self, utterance):
+        self.mark(utterance, "playback_start")
+        self.emit("playback_start", utterance)
+
+
+class _Flush:
+    pass
+
+
+class _Audio:
+    def __init__(self, audio, captured_at=None):
+        self.audio = audio
+        self.captured_at = captured_at if captured_at is not None else time.monotonic()
@@ -0,0 +1,158 @@
+# playback.py
+import queue
+import threading
+import numpy as np
+import sounddevice as sd
+import soundfile as sf
+from resampling import resample
+
+_CLOSE = object()
+
+
+class StreamPlayer:
+    def __init__(self, samplerate, channels=1, dtype='int16', block_frames=2048, on_error=None):
+        self.samplerate = samplerate
+        self.channels = channels
+        self.dtype = dtype
+        self.block_frames = block_frames
+        self.on_error = on_error
+        self.chunks = queue.Queue()
+        self.clips = queue.Queue()
+        # the decoder may run one clip ahead of the one being written
+        self.decode_ahead = threading.Semaphore(1)
+        self.generation = 0
+        self.skip_event = threading.Event()
+        # generation of the live utterance being fed, None between utterances
+        self.streaming = None
+        self.live = threading.Condition()
+        self.thread = None
+        self.decoder = None
+        self.lock = threading.Lock()
+
+    def start(self):
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.run, name="stream-player", daemon=True)
+                self.thread.start()
+            if self.decoder is None or not self.decoder.is_alive():
+                self.decoder = threading.Thread(target=self.decode, name="stream-player-decoder", daemon=True)
+                self.decoder.start()
+
+    def feed(self, chunk, on_start=None):
+        self.start()
+        with self.live:
+            if on_start is not None:
+                # decoded clips wait until this utterance has been fed in full
+                self.streaming = self.generation
+            generation = self.generation if self.streaming is None else self.streaming
+            self.chunks.put((generation, chunk, on_start, None))
+
+    def end_stream(self):
+        with self.live:
+            self.streaming = None
+            self.live.notify_all()
+
+    def play_file(self, source, on_start=None, on_done=None):
+        # source is a file path or a (pcm, sample_rate) pair of raw samples
+        self.start()
+        self.clips.put((self.generation, source, on_start, on_done))
+
+    def skip(self):
+        self.skip_event.set()
+
+    def cancel(self):
+        with self.live:
+            self.generation += 1
+            # the rest of a live utterance keeps the old generation and is dropped
+            self.streaming = None
+            self.live.notify_all()
+        # decoded audio already queued is dropped by the writer once it sees the old generation
+        while True:
+            try:
+                item = self.clips.get_nowait()
+            except queue.Empty:
+                break
+            if item is _CLOSE:
+                self.clips.put(_CLOSE)
+                break
+        self.skip_event.set()
+
+    def close(self):
+        self.clips.put(_CLOSE)
+
+    def read_clip(self, source):
+        if isinstance(source, tuple):
+            pcm, rate = source
+            data = np.frombuffer(pcm, dtype=self.dtype).reshape(-1, self.channels)
+        else:
+            data, rate = sf.read(source, dtype=self.dtype, always_2d=True)
+        if data.shape[1] != self.channels:
+            data = np.repeat(data.mean(axis=1, keepdims=True), self.channels, axis=1).astype(self.dtype)
+        data = resample(data, rate, self.samplerate)
+        return np.ascontiguousarray(data)
+
+    def decode(self):
+        while True:
+            item = self.clips.get()
+            if item is _CLOSE:
+                self.chunks.put(_CLOSE)
+                return
+            generation, source, on_start, on_done = item
+            self.decode_ahead.acquire()
+            if generation != self.generation:
+                self.decode_ahead.release()
+                continue
+            try:
+                data = self.read_clip(source)
+            except Exception as e:
+                self.decode_ahead.release()
+                if self.on_error:
+                    self.on_error(source, e)
+                continue
+            with self.live:
+                while self.streaming is not None:
+                    self.live.wait()
+                if generation != self.generation:
+                    self.decode_ahead.release()
+                    continue
+                self.chunks.put((generation, data, on_start, on_done))
+
+    def run(self):
+        with sd.RawOutputStream(samplerate=self.samplerate, channels=self.channels, dtype=self.dtype) as stream:
+            skipping = False
+            while True:
+                item = self.chunks.get()
+                if item is _CLOSE:
+                    break
+                generation, audio, on_start, on_done = item
+                clip = isinstance(audio, np.ndarray)
+                if clip:
+                    # let the decoder prepare the next clip while this one plays
+                    self.decode_ahead.release()
+                if generation != self.generation:
+                    continue
+
+                # a clip or the first chunk of a live utterance starts something new; earlier skips are spent
+                if clip or on_start is not None:
+                    self.skip_event.clear()
+                    skipping = False
+                    if on_start is not None:
+                        on_start()
+                if clip:
+                    completed = self.write_clip(stream, audio, generation)
+                    if on_done is not None:
+                        on_done(completed)
+                    continue
+
+                # a skip during live audio drops the rest of that utterance's chunks
+                skipping = skipping or self.skip_event.is_set()
+                if not skipping:
+                    stream.write(audio)
+
+    def write_clip(self, stream, data, generation):
+        # written in blocks so skip and cancel take effect within one block
+        for offset in range(0, len(data), self.block_frames):
+            if self.skip_event.is_set() or generation != self.generation:
+                return False
+            stream.write(data[offset:offset + self.block_frames])
+        return True
@@ -0,0 +1,73 @@
+# recording_buffer.py
+import numpy as np
+import soundfile as sf
+
+
+class RecordingBuffer:
+    def __init__(self, samplerate=16000, initial_seconds=30, max_memory_seconds=600, spill_path=None):
+        self.samplerate = samplerate
+        self.max_memory_samples = int(max_memory_seconds * samplerate)
+        self.data = np.empty(int(initial_seconds * samplerate), dtype=np.int16)
+        self.length = 0
+        self.spill_path = spill_path
+        self.writer = None
+        self.spilled_samples = 0
+
+    def __len__(self):
+        return self.spilled_samples + self.length
+
+    @property
+    def duration(self):
+        return len(self) / self.samplerate
+
+    def append(self, block):
+        samples = np.asarray(block, dtype=np.int16).reshape(-1)
+        if self.writer is not None:
+            self.writer.write(samples)
+            self.spilled_samples += len(samples)
+            return
+
+        needed = self.length + len(samples)
+        if needed > len(self.data):
+            if needed > self.max_memory_samples and self.spill_path:
+                self.spill()
+                self.append(samples)
+                return
+            size = max(needed, len(self.data) * 2)
+            if self.spill_path:
+                # doubling stops at the cap; once that fills up, the next append spills
+                size = min(size, self.max_memory_samples)
+            grown = np.empty(size, dtype=np.int16)
+            grown[:self.length] = self.data[:self.length]
+            self.data = grown
+
+        self.data[self.length:needed] = samples
+        self.length = needed
+
+    def spill(self):
+        self.writer = sf.SoundFile(self.spill_path, mode='w', samplerate=self.samplerate, channels=1, subtype='PCM_16')
+        self.writer.write(self.data[:self.length])
+        self.spilled_samples = self.length
+        self.data = np.empty(0, dtype=np.int16)
+        self.length = 0
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+    def to_float32(self):
+        if self.spill_path and self.spilled_samples:
+            self.close()
+            audio, _ = sf.read(self.spill_path, dtype='float32')
+            return audio
+        return self.data[:self.length].astype(np.float32) / 32768.0
+
+    def save(self, file_path):
+        if self.spilled_samples:
+            self.close()
+            if file_path != self.spill_path:
+                sf.write(file_path, sf.read(self.spill_path, dtype='int16')[0], self.samplerate)
+            return file_path
+        sf.write(file_path, self.data[:self.length], self.samplerate)
+        return file_path
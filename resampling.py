@@ -0,0 +1,29 @@
+# resampling.py
+import numpy as np
+import soundfile as sf
+import soxr
+
+BLOCK_SECONDS = 30
+
+
+def resample(audio, rate, target_rate):
+    # soxr low-passes before decimating, so 44.1/48 kHz audio does not alias into the speech band
+    if rate == target_rate:
+        return audio
+    return soxr.resample(audio, rate, target_rate)
+
+
+def load_mono(path, target_rate, block_seconds=BLOCK_SECONDS):
+    # decoded and resampled a block at a time, so a long file is never held whole at its own rate
+    parts = []
+    with sf.SoundFile(path) as f:
+        rate = f.samplerate
+        stream = soxr.ResampleStream(rate, target_rate, 1, dtype='float32') if rate != target_rate else None
+        for block in f.blocks(blocksize=int(rate * block_seconds), dtype='float32', always_2d=True):
+            mono = block.mean(axis=1)
+            parts.append(stream.resample_chunk(mono) if stream is not None else mono)
+        if stream is not None:
+            parts.append(stream.resample_chunk(np.empty(0, dtype=np.float32), last=True))
+    if not parts:
+        return np.empty(0, dtype=np.float32)
+    return np.concatenate(parts)
@@ -0,0 +1,228 @@
+# server.py
+import argparse
+import asyncio
+import itertools
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+import websockets
+from asr import VoskASR
+from model import voskModels, voskLanguageCodes
+from model_registry import get_registry
+from pipeline import Utterance
+from translation import Translator
+from translation_backends import BACKENDS as TRANSLATION_BACKENDS, DEFAULT_BACKEND as DEFAULT_TRANSLATION_BACKEND, get_backend
+from translation_cache import TranslationCache
+from tts import ElevenLabsTTS
+from tts_cache import AudioCache
+
+DEFAULT_PORT = 2700
+_session_ids = itertools.count(1)
+
+
+class RecognitionSession:
+    def __init__(self, server, websocket, config):
+        self.server = server
+        self.websocket = websocket
+        self.id = next(_session_ids)
+        self.language = config.get("language", "English")
+        self.size = config.get("size", "small")
+        self.sample_rate = int(config.get("sample_rate", 16000))
+        self.target = config.get("target")
+        self.tts = bool(config.get("tts")) and server.tts is not None
+        self.translator = None
+        self.asr = None
+        self.utterance = None
+        self.outbox = asyncio.Queue()
+
+    async def send(self, event, **fields):
+        fields["type"] = event
+        await self.websocket.send(json.dumps(fields, ensure_ascii=False))
+
+    async def open(self):
+        loop = asyncio.get_running_loop()
+        # the registry loads each model once; every session gets its own recognizer over it
+        recognizer = await loop.run_in_executor(
+            self.server.recognition_pool, get_registry().recognizer, self.language, self.size, self.sample_rate
+        )
+        self.asr = VoskASR(recognizer)
+        await self.send("ready", session=self.id, cpu_count=os.cpu_count())
+
+    async def recognize(self, data):
+        if self.utterance is None:
+            self.utterance = Utterance(target=self.target)
+            self.utterance.mark("capture")
+
+        loop = asyncio.get_running_loop()
+        partials = []
+        text = await loop.run_in_executor(self.server.recognition_pool, self.asr.process, data, partials.append)
+        for partial in partials:
+            await self.send("partial", id=self.utterance.id, text=partial)
+        if text:
+            await self.finish(text)
+
+    async def flush(self):
+        loop = asyncio.get_running_loop()
+        text = await loop.run_in_executor(self.server.recognition_pool, self.asr.flush)
+        if text:
+            if self.utterance is None:
+                self.utterance = Utterance(target=self.target)
+            await self.finish(text)
+
+    async def finish(self, text):
+        utterance, self.utterance = self.utterance, None
+        utterance.text = text
+        utterance.mark("asr_final")
+        await self.send("final", id=utterance.id, text=text)
+        if self.target:
+            # translation and TTS run behind recognition so a slow request never stalls the audio
+            self.outbox.put_nowait(utterance)
+
+    async def follow_up(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            utterance = await self.outbox.get()
+            if utterance is None:
+                return
+            try:
+                utterance.translation = await loop.run_in_executor(
+                    self.server.io_pool, self.translator.translate, utterance.text, utterance.target
+                )
+                utterance.mark("translated")
+                await self.send("translation", id=utterance.id, text=utterance.translation, target=utterance.target)
+                if self.tts and utterance.translation:
+                    await self.speak(utterance)
+            except websockets.ConnectionClosed:
+                return
+            except Exception as e:
+                stage = "translate" if utterance.translation is None else "tts"
+                try:
+                    await self.send("error", id=utterance.id, stage=stage, message=str(e))
+                except websockets.ConnectionClosed:
+                    return
+
+    async def speak(self, utterance):
+        loop = asyncio.get_running_loop()
+        tts = self.server.tts
+
+        def stream():
+            for chunk in tts.stream(utterance.translation):
+                if "tts_first_byte" not in utterance.timestamps:
+                    utterance.mark("tts_first_byte")
+                    asyncio.run_coroutine_threadsafe(
+                        self.send("tts_start", id=utterance.id, sample_rate=tts.sample_rate), loop
+                    ).result()
+                asyncio.run_coroutine_threadsafe(self.websocket.send(chunk), loop).result()
+
+        await loop.run_in_executor(self.server.io_pool, stream)
+        utterance.mark("tts_complete")
+        await self.send("tts_end", id=utterance.id)
+
+
+class RecognitionServer:
+    def __init__(self, workers=None, io_workers=8, tts=None, translation_backend=DEFAULT_TRANSLATION_BACKEND):
+        self.recognition_pool = ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1, thread_name_prefix="recognize")
+        self.io_pool = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="server-io")
+        self.translation_backend = translation_backend
+        self.translation_cache = TranslationCache()
+        self.translators = {}
+        self.tts = tts
+        self.sessions = 0
+
+    def get_translator(self, source):
+        # local backends are per language pair, so each spoken language gets its own translator
+        translator = self.translators.get(source)
+        if translator is None:
+            backend = get_backend(self.translation_backend, source=source)
+            translator = self.translators[source] = Translator(cache=self.translation_cache, backend=backend)
+        return translator
+
+    async def handle(self, websocket):
+        try:
+            config = json.loads(await websocket.recv())
+            session = RecognitionSession(self, websocket, config)
+        except websockets.ConnectionClosed:
+            return
+        except (ValueError, TypeError, AttributeError):
+            # not JSON, not an object, or a field of the wrong type
+            try:
+                await websocket.send(json.dumps({"type": "error", "stage": "config", "message": "expected a JSON config object first"}))
+                await websocket.close(1003, "expected a JSON config message first")
+            except websockets.ConnectionClosed:
+                pass
+            return
+
+        if session.language not in voskModels or session.size not in voskModels[session.language]:
+            await session.send("error", stage="config", message=f"Unknown model {session.language}/{session.size}")
+            return
+        if session.target:
+            session.translator = self.get_translator(voskLanguageCodes[session.language])
+
+        try:
+            await session.open()
+        except Exception as e:
+            await session.send("error", stage="model", message=str(e))
+            return
+
+        self.sessions += 1
+        follow_up = asyncio.create_task(session.follow_up())
+        try:
+            async for message in websocket:
+                if isinstance(message, bytes):
+                    await session.recognize(message)
+                else:
+                    try:
+                        control = json.loads(message)
+                    except ValueError:
+                        await session.send("error", stage="protocol", message="text frames must be JSON")
+                        continue
+                    if isinstance(control, dict) and control.get("type") == "eof":
+                        await session.flush()
+                        break
+            session.outbox.put_nowait(None)
+            await follow_up
+            await session.send("done", session=session.id)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            follow_up.cancel()
+            self.sessions -= 1
+
+    async def serve(self, host, port):
+        async with websockets.serve(self.handle, host, port, max_size=2 ** 22):
+            print(f"Listening on ws://{host}:{port}")
+            await asyncio.Future()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Serve Vosk recognition to many WebSocket clients at once.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="recognition threads")
+    parser.add_argument("--preload", nargs="*", default=[], metavar="LANGUAGE:SIZE", help="models to load before accepting clients")
+    parser.add_argument("--elevenlabs-key", default=os.environ.get("ELEVENLABS_API_KEY"))
+    parser.add_argument("--voice-id", help="ElevenLabs voice for sessions that ask for TTS")
+    parser.add_argument("--translation-backend", choices=list(TRANSLATION_BACKENDS), default=DEFAULT_TRANSLATION_BACKEND)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    registry = get_registry()
+    for key in args.preload:
+        language, _, size = key.partition(":")
+        registry.get_model(language, size or "small")
+
+    tts = None
+    if args.elevenlabs_key and args.voice_id:
+        tts = ElevenLabsTTS(args.elevenlabs_key, args.voice_id, cache=AudioCache())
+
+    server = RecognitionServer(workers=args.workers, tts=tts, translation_backend=args.translation_backend)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
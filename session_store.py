@@ -0,0 +1,189 @@
+# session_store.py
+import json
+import mmap
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from tts import save_pcm
+
+DEFAULT_SESSION_PATH = os.path.join("sessions", "session.sqlite3")
+DEFAULT_AUDIO_PATH = os.path.join("sessions", "audio.seg")
+PCM_FORMAT = "pcm_s16le"
+
+_UTTERANCE_COLUMNS = {
+    "broadcast_id": "TEXT",
+}
+_CLIP_COLUMNS = {
+    "utterance_id": "INTEGER",
+    "audio_offset": "INTEGER",
+    "audio_length": "INTEGER",
+    "sample_rate": "INTEGER",
+    "format": "TEXT",
+    "target": "TEXT",
+}
+
+
+class SessionStore:
+    def __init__(self, path=DEFAULT_SESSION_PATH, audio_path=DEFAULT_AUDIO_PATH):
+        self.path = path
+        self.audio_path = audio_path
+        self.lock = threading.Lock()
+
+        for file_path in (path, audio_path):
+            directory = os.path.dirname(file_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS utterances ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, tab TEXT NOT NULL, text TEXT, translation TEXT, "
+            "target TEXT, start_time REAL, end_time REAL, timestamps TEXT, created REAL NOT NULL)"
+        )
+        self.add_columns("utterances", _UTTERANCE_COLUMNS)
+        self.db.execute("CREATE INDEX IF NOT EXISTS utterances_tab ON utterances (tab, id)")
+        # AUTOINCREMENT keeps ids, and so export names, unique even after the newest clip is deleted
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS clips ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, tab TEXT NOT NULL, path TEXT, "
+            "text TEXT, translation TEXT, created REAL NOT NULL)"
+        )
+        self.add_columns("clips", _CLIP_COLUMNS)
+        self.db.execute("CREATE INDEX IF NOT EXISTS clips_tab ON clips (tab, id)")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS scrollback ("
+            "id INTEGER PRIMARY KEY, tab TEXT NOT NULL, area TEXT NOT NULL, "
+            "line TEXT NOT NULL, archived REAL NOT NULL)"
+        )
+        self.db.commit()
+
+        # audio is only ever appended; the clips table holds each clip's offset and length
+        self.audio_file = open(audio_path, "ab")
+        self.mapped = None
+
+    def add_columns(self, table, columns):
+        existing = {row[1] for row in self.db.execute(f"PRAGMA table_info({table})")}
+        for column, column_type in columns.items():
+            if column not in existing:
+                self.db.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+
+    def record_utterance(self, tab, utterance):
+        with self.lock:
+            cursor = self.db.execute(
+                "INSERT INTO utterances (tab, broadcast_id, text, translation, target, start_time, end_time, timestamps, created) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (tab, utterance.broadcast_id, utterance.text, utterance.translation, utterance.target, utterance.start,
+                 utterance.end, json.dumps(utterance.timestamps), time.time())
+            )
+            self.db.commit()
+            return cursor.lastrowid
+
+    def recent_utterances(self, tab, limit=100):
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT text, translation, target, broadcast_id FROM utterances WHERE tab = ? ORDER BY id DESC LIMIT ?",
+                (tab, limit)
+            ).fetchall()
+        return rows[::-1]
+
+    def add_clip(self, tab, pcm, sample_rate, utterance=None):
+        with self.lock:
+            # the file's real size, not this handle's position, in case anything else appended
+            offset = os.fstat(self.audio_file.fileno()).st_size
+            self.audio_file.write(pcm)
+            self.audio_file.flush()
+
+            record_id = getattr(utterance, "record_id", None)
+            cursor = self.db.execute(
+                "INSERT INTO clips (tab, utterance_id, text, translation, target, audio_offset, audio_length, sample_rate, format, created) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (tab, record_id, getattr(utterance, "text", None), getattr(utterance, "translation", None),
+                 getattr(utterance, "target", None), offset, len(pcm), sample_rate, PCM_FORMAT, time.time())
+            )
+            if record_id is not None:
+                # the utterance row was written at translation time; keep the TTS timings too
+                self.db.execute(
+                    "UPDATE utterances SET timestamps = ? WHERE id = ?", (json.dumps(utterance.timestamps), record_id)
+                )
+            self.db.commit()
+            return cursor.lastrowid
+
+    def remove_clip(self, clip_id):
+        with self.lock:
+            self.db.execute("DELETE FROM clips WHERE id = ?", (clip_id,))
+            self.db.commit()
+
+    def count_clips(self, tab):
+        with self.lock:
+            return self.db.execute("SELECT COUNT(*) FROM clips WHERE tab = ?", (tab,)).fetchone()[0]
+
+    def clip_ids(self, tab, offset=0, limit=-1):
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT id FROM clips WHERE tab = ? ORDER BY id LIMIT ? OFFSET ?", (tab, limit, offset)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def clip_entries(self, tab, offset=0, limit=-1):
+        # (id, target language) pairs; the target is None for clips saved before it was recorded
+        with self.lock:
+            return self.db.execute(
+                "SELECT id, target FROM clips WHERE tab = ? ORDER BY id LIMIT ? OFFSET ?", (tab, limit, offset)
+            ).fetchall()
+
+    def clip_source(self, clip_id):
+        with self.lock:
+            row = self.db.execute(
+                "SELECT path, audio_offset, audio_length, sample_rate FROM clips WHERE id = ?", (clip_id,)
+            ).fetchone()
+            if row is None:
+                raise KeyError(clip_id)
+            path, offset, length, sample_rate = row
+            if offset is None:
+                # clips indexed before the audio archive existed still live in their own files
+                return path
+            return self.view(offset, length), sample_rate
+
+    def view(self, offset, length):
+        end = offset + length
+        if length == 0:
+            return memoryview(b"")
+        if self.mapped is None or len(self.mapped) < end:
+            # remap to cover appends; views into the old map keep it alive until they are released
+            with open(self.audio_path, "rb") as f:
+                self.mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(self.mapped)[offset:end]
+
+    def export_clip(self, clip_id, path):
+        source = self.clip_source(clip_id)
+        if isinstance(source, str):
+            shutil.copy(source, path)
+        else:
+            pcm, sample_rate = source
+            save_pcm(path, pcm, sample_rate)
+        return path
+
+    def archive_lines(self, tab, area, lines):
+        archived = time.time()
+        with self.lock:
+            self.db.executemany(
+                "INSERT INTO scrollback (tab, area, line, archived) VALUES (?, ?, ?, ?)",
+                [(tab, area, line, archived) for line in lines]
+            )
+            self.db.commit()
+
+    def archived_lines(self, tab, area, limit=-1):
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT line FROM scrollback WHERE tab = ? AND area = ? ORDER BY id LIMIT ?", (tab, area, limit)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def close(self):
+        with self.lock:
+            if self.db is not None:
+                self.db.close()
+                self.db = None
+            self.audio_file.close()
+            self.mapped = None
@@ -0,0 +1,6 @@
+# tests/conftest.py
+import os
+import sys
+
+# the modules live at the top of the repository, not in a package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,42 @@
+# tests/test_session_store.py
+from session_store import SessionStore
+
+
+def test_interleaved_tabs_read_back_their_own_clips(tmp_path):
+    store = SessionStore(str(tmp_path / "session.sqlite3"), str(tmp_path / "audio.seg"))
+    clips = [("vosk", b"AAAA"), ("whisper", b"BBBBBB"), ("vosk", b"CC"), ("whisper", b"DDDDDDDD")]
+    ids = [store.add_clip(tab, pcm, 22050) for tab, pcm in clips]
+
+    for clip_id, (_, pcm) in zip(ids, clips):
+        data, rate = store.clip_source(clip_id)
+        assert bytes(data) == pcm
+        assert rate == 22050
+    assert store.clip_ids("vosk") == [ids[0], ids[2]]
+    assert store.clip_ids("whisper") == [ids[1], ids[3]]
+    store.close()
+
+
+def test_offsets_follow_the_file_when_another_store_appended(tmp_path):
+    paths = (str(tmp_path / "session.sqlite3"), str(tmp_path / "audio.seg"))
+    first = SessionStore(*paths)
+    second = SessionStore(*paths)
+    a = first.add_clip("vosk", b"AAA", 16000)
+    b = second.add_clip("whisper", b"BBB", 16000)
+    c = first.add_clip("vosk", b"CCC", 16000)
+
+    assert [bytes(first.clip_source(clip_id)[0]) for clip_id in (a, b, c)] == [b"AAA", b"BBB", b"CCC"]
+    first.close()
+    second.close()
+
+def test_clip_entries_carry_the_target_language(tmp_path):
+    from pipeline import Utterance
+
+    store = SessionStore(str(tmp_path / "session.sqlite3"), str(tmp_path / "audio.seg"))
+    utterance = Utterance(text="hello", target="fr")
+    utterance.translation = "bonjour"
+    french = store.add_clip("vosk", b"FF", 16000, utterance)
+    plain = store.add_clip("vosk", b"PP", 16000)
+
+    assert store.clip_entries("vosk") == [(french, "fr"), (plain, None)]
+    assert store.clip_entries("vosk", 1, 1) == [(plain, None)]
+    store.close()
@@ -0,0 +1,20 @@
+# tests/test_translation_backends.py
+from benchmarks.fake_services import FakeServices
+from http_client import HttpClient
+from translation import Translator
+from translation_backends import GoogleBackend
+
+
+def test_google_backend_parses_the_translate_page():
+    with FakeServices(translate_latency=0) as services:
+        backend = GoogleBackend(source="en", client=HttpClient(), base_url=services.translate_url)
+        assert backend.translate("Good morning", "es") == "[es] Good morning"
+        assert services.requests["translate"] == 1
+
+
+def test_google_backend_batches_lines_into_one_request():
+    with FakeServices(translate_latency=0) as services:
+        translator = Translator(source="en", client=HttpClient(), base_url=services.translate_url)
+        texts = ["Good morning", "Thank you", "See you  soon"]
+        assert translator.translate_batch(texts, "fr") == ["[fr] Good morning", "Thank you", "See you soon"]
+        assert services.requests["translate"] == 1
@@ -0,0 +1,91 @@
+# text_renderer.py
+import threading
+import tkinter as tk
+
+DEFAULT_FRAME_MS = 33
+DEFAULT_SCROLLBACK_LINES = 1000
+
+
+class TextRenderer:
+    def __init__(self, root, widget, dispatcher, interval=DEFAULT_FRAME_MS, max_lines=DEFAULT_SCROLLBACK_LINES,
+                 on_trim=None):
+        self.root = root
+        self.widget = widget
+        self.dispatcher = dispatcher
+        self.interval = interval  # milliseconds
+        self.max_lines = max_lines
+        self.on_trim = on_trim
+        self.lock = threading.Lock()
+        self.lines = []
+        self.partial = None
+        self.cleared = False
+        self.scheduled = False
+        self.partial_shown = False
+        self.line_count = 0
+
+    def append(self, text):
+        with self.lock:
+            self.lines.append(text)
+            # a final result replaces whatever partial was showing
+            self.partial = None
+            self.schedule()
+
+    def set_partial(self, text):
+        with self.lock:
+            self.partial = text
+            self.schedule()
+
+    def clear(self):
+        with self.lock:
+            self.lines = []
+            self.partial = None
+            self.cleared = True
+            self.schedule()
+
+    def schedule(self):
+        if not self.scheduled:
+            self.scheduled = True
+            # callers may be worker threads; only the Tk thread may touch root.after
+            self.dispatcher.post(self.root.after, self.interval, self.render)
+
+    def render(self):
+        with self.lock:
+            lines, self.lines = self.lines, []
+            partial, cleared = self.partial, self.cleared
+            self.cleared = False
+            self.scheduled = False
+
+        widget = self.widget
+        widget.configure(state='normal')
+        if cleared:
+            widget.delete('1.0', tk.END)
+            self.line_count = 0
+            self.partial_shown = False
+        if self.partial_shown:
+            widget.delete("partial", "end-1c")
+            self.partial_shown = False
+
+        if lines:
+            text = "".join(f"{line}\n" for line in lines)
+            widget.insert(tk.END, text)
+            self.line_count += text.count("\n")
+        if partial:
+            widget.mark_set("partial", "end-1c")
+            widget.mark_gravity("partial", tk.LEFT)
+            widget.insert(tk.END, partial)
+            self.partial_shown = True
+
+        self.trim()
+        widget.configure(state='disabled')
+        widget.see(tk.END)
+
+    def trim(self):
+        excess = self.line_count - self.max_lines
+        if excess <= 0:
+            return
+        end = f"{excess + 1}.0"
+        archived = self.widget.get('1.0', end)
+        self.widget.delete('1.0', end)
+        self.line_count -= excess
+        if self.on_trim:
+            self.on_trim(archived.splitlines())
@@ -1,17 +1,21 @@
 # transcription.py
-import tkinter as tk
 import threading
-import queue
-import sounddevice as sd
-import json
+import time
+from asr import VoskASR
+from audio_capture import AudioCapture
+from vad import VadGate
 from tkinter import messagebox
 
 class TranscriptionManager:
     def __init__(self, gui):
         self.gui = gui
         self.transcribing = False
-        self.audio_queue = queue.Queue()
+        self.blocksize = 1600  # frames per block, 100 ms at 16 kHz
+        self.capture = None
         self.transcription_thread = None
+        self.recognizer = None
+        self.use_vad = True
+        self.vad = None
         self.stop_event = threading.Event()
 
     def start_transcription(self):
@@ -23,11 +27,11 @@ class TranscriptionManager:
             messagebox.showinfo("Info", "Please load the model first.")
             return
 
+        self.recognizer = self.gui.model_handler.create_recognizer()
+        self.vad = VadGate() if self.use_vad else None
         self.transcribing = True
         self.stop_event.clear()
-        self.gui.transcription_area.configure(state='normal')
-        self.gui.transcription_area.delete('1.0', tk.END)
-        self.gui.transcription_area.configure(state='disabled')
+        self.gui.transcription_renderer.clear()
 
         self.transcription_thread = threading.Thread(target=self.transcribe)
         self.transcription_thread.start()
@@ -40,36 +44,54 @@ class TranscriptionManager:
 
         self.stop_event.set()
         self.transcribing = False
-        messagebox.showinfo("Info", "Transcription stopped.")
+        message = "Transcription stopped."
+        if self.capture is not None:
+            stats = self.capture.stats()
+            if stats["input_overflows"] or stats["dropped_blocks"]:
+                message += (f"\n{stats['input_overflows']} input overflows and "
+                            f"{stats['dropped_blocks']} dropped audio blocks were detected.")
+        messagebox.showinfo("Info", message)
 
-    def transcribe(self):
-        def callback(indata, frames, time_info, status):
-            if self.stop_event.is_set():
-                raise sd.CallbackStop()
-            self.audio_queue.put(bytes(indata))
+    def timestamps(self, captured_at):
+        timestamps = {"asr_final": time.monotonic()}
+        if captured_at is not None:
+            timestamps["capture"] = float(captured_at)
+        return timestamps
 
+    def transcribe(self):
         try:
-            with sd.RawInputStream(
-                samplerate=16000,
-                blocksize=8000,
-                dtype='int16',
-                channels=1,
-                callback=callback
-            ):
+            self.capture = AudioCapture(samplerate=16000, blocksize=self.blocksize)
+            with self.capture:
+                asr = VoskASR(self.recognizer)
+                on_partial = lambda partial: self.gui.update_transcription(partial, final=False)
+                captured_at = None
                 while not self.stop_event.is_set():
-                    data = self.audio_queue.get()
-                    if self.gui.model_handler.recognizer.AcceptWaveform(data):
-                        result = self.gui.model_handler.recognizer.Result()
-                        result_dict = json.loads(result)
-                        text = result_dict.get("text", "")
+                    block = self.capture.read(timeout=0.1)
+                    if block is None:
+                        continue
+
+                    try:
+                        endpoint = False
+                        data = block
+                        if self.vad is not None:
+                            speech, endpoint = self.vad.process(block)
+                            data = speech.tobytes() if speech is not None else None
+
+                        if data:
+                            if captured_at is None:
+                                captured_at = self.capture.block_time
+                            text = asr.process(data, on_partial=on_partial)
+                            if text:
+                                self.gui.update_transcription(text, final=True, timestamps=self.timestamps(captured_at))
+                                captured_at = None
+                    finally:
+                        self.capture.release()
+
+                    if endpoint:
+                        text = asr.flush()
                         if text:
-                            self.gui.update_transcription(text, final=True)
-                    else:
-                        partial_result = self.gui.model_handler.recognizer.PartialResult()
-                        partial_dict = json.loads(partial_result)
-                        partial = partial_dict.get("partial", "")
-                        if partial:
-                            self.gui.update_transcription(partial, final=False)
+                            self.gui.update_transcription(text, final=True, timestamps=self.timestamps(captured_at))
+                        captured_at = None
         except Exception as e:
             self.transcribing = False
             messagebox.showerror("Error", f"An error occurred during transcription: {e}")
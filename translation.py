@@ -0,0 +1,64 @@
+# translation.py
+from deep_translator import GoogleTranslator
+from translation_backends import GoogleBackend
+
+
+def get_google_translate_languages():
+    languages = GoogleTranslator().get_supported_languages(as_dict=True)
+    return {lang.capitalize(): code for lang, code in languages.items()}
+
+
+def parse_targets(spec, languages):
+    # "French, de:VOICE_ID" -> [("fr", None), ("de", "VOICE_ID")]
+    targets = []
+    for entry in spec.split(","):
+        name, _, voice_id = entry.partition(":")
+        name = name.strip()
+        if name:
+            targets.append((languages.get(name.capitalize(), name.lower()), voice_id.strip() or None))
+    return targets
+
+
+class Translator:
+    def __init__(self, source='auto', client=None, base_url=None, cache=None, backend=None):
+        self.cache = cache
+        self.backend = backend or GoogleBackend(source, client, base_url)
+
+    @property
+    def source(self):
+        return self.backend.source
+
+    def translate(self, text, target):
+        text = " ".join(text.split())
+        if self.cache is not None:
+            cached = self.cache.get(self.source, target, text)
+            if cached is not None:
+                return cached
+
+        translation = self.backend.translate(text, target)
+        if self.cache is not None and translation:
+            self.cache.put(self.source, target, text, translation)
+        return translation
+
+    def translate_batch(self, texts, target):
+        texts = [" ".join(text.split()) for text in texts]
+        results = [None] * len(texts)
+        pending = {}
+        for index, text in enumerate(texts):
+            cached = None
+            if self.cache is not None:
+                cached = self.cache.get(self.source, target, text)
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.setdefault(text, []).append(index)
+
+        if pending:
+            missing = list(pending)
+            translations = self.backend.translate_batch(missing, target)
+            for text, translation in zip(missing, translations):
+                for index in pending[text]:
+                    results[index] = translation
+                if self.cache is not None and translation:
+                    self.cache.put(self.source, target, text, translation)
+        return results
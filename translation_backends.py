@@ -0,0 +1,202 @@
+# translation_backends.py
+import os
+import threading
+from collections import OrderedDict
+from bs4 import BeautifulSoup
+from deep_translator import GoogleTranslator
+from deep_translator.exceptions import RequestError, TooManyRequests, TranslationNotFound
+from deep_translator.validate import is_empty, is_input_valid, request_failed
+from http_client import get_client
+
+DEFAULT_BACKEND = "google"
+DEFAULT_LOCAL_MODEL_DIR = os.path.join("models", "translation")
+MAX_REQUEST_CHARS = 5000
+
+
+class PooledGoogleTranslator(GoogleTranslator):
+    def __init__(self, source="auto", target="en", client=None, base_url=None, **kwargs):
+        super().__init__(source=source, target=target, **kwargs)
+        self.client = client or get_client()
+        if base_url:
+            self._base_url = base_url
+
+    def translate(self, text, **kwargs):
+        # same request and parsing as GoogleTranslator.translate, over the shared session
+        if not is_input_valid(text, max_chars=5000):
+            return None
+        text = text.strip()
+        if self._same_source_target() or is_empty(text):
+            return text
+
+        params = dict(self._url_params, tl=self._target, sl=self._source)
+        params[self.payload_key] = text
+        response = self.client.get(self._base_url, params=params, proxies=self.proxies)
+        if response.status_code == 429:
+            raise TooManyRequests()
+        if request_failed(status_code=response.status_code):
+            raise RequestError()
+
+        soup = BeautifulSoup(response.text, "html.parser")
+        element = soup.find(self._element_tag, self._element_query)
+        if not element:
+            element = soup.find(self._element_tag, self._alt_element_query)
+            if not element:
+                raise TranslationNotFound(text)
+        return element.get_text(strip=True)
+
+
+class GoogleBackend:
+    name = "google"
+
+    def __init__(self, source="auto", client=None, base_url=None):
+        self.source = source
+        self.client = client
+        self.base_url = base_url
+        self.translators = {}
+        self.lock = threading.Lock()
+
+    def get_translator(self, target):
+        with self.lock:
+            translator = self.translators.get(target)
+            if translator is None:
+                translator = PooledGoogleTranslator(
+                    source=self.source,
+                    target=target,
+                    client=self.client,
+                    base_url=self.base_url
+                )
+                self.translators[target] = translator
+            return translator
+
+    def translate(self, text, target):
+        return self.get_translator(target).translate(text)
+
+    def translate_batch(self, texts, target):
+        # one request per group of lines; Google keeps line breaks, so the reply splits back in order
+        translator = self.get_translator(target)
+        translations = []
+        for group in self.group_for_request(texts):
+            if len(group) == 1:
+                translations.append(translator.translate(group[0]))
+                continue
+            joined = translator.translate("\n".join(group)) or ""
+            lines = [line.strip() for line in joined.split("\n") if line.strip()]
+            if len(lines) == len(group):
+                translations.extend(lines)
+            else:
+                translations.extend(translator.translate_batch(group))
+        return translations
+
+    def group_for_request(self, texts):
+        group = []
+        length = 0
+        for text in texts:
+            if group and length + len(text) + 1 > MAX_REQUEST_CHARS:
+                yield group
+                group = []
+                length = 0
+            group.append(text)
+            length += len(text) + 1
+        if group:
+            yield group
+
+
+class MarianBackend:
+    name = "marian-ct2"
+
+    def __init__(self, source="en", model_dir=DEFAULT_LOCAL_MODEL_DIR, compute_type="int8",
+                 cpu_threads=None, beam_size=2, max_batch_size=32, max_models=4):
+        # Marian models are trained per language pair, so the source cannot be "auto"
+        if source in (None, "auto"):
+            raise ValueError(f"The {self.name} backend needs the spoken language, e.g. source='en'; it cannot auto-detect.")
+        self.source = source
+        self.model_dir = model_dir
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads or os.cpu_count() or 4
+        self.beam_size = beam_size
+        self.max_batch_size = max_batch_size
+        self.max_models = max_models
+        self.models = OrderedDict()
+        self.loading = {}
+        self.lock = threading.Lock()
+
+    def model_path(self, target):
+        return os.path.join(self.model_dir, f"opus-mt-{self.source}-{target}")
+
+    def load(self, target):
+        # loaded once per language pair and kept warm; the least recently used pair is dropped first.
+        # a cold load runs outside the lock so languages that are already warm keep translating
+        while True:
+            with self.lock:
+                model = self.models.get(target)
+                if model is not None:
+                    self.models.move_to_end(target)
+                    return model
+                event = self.loading.get(target)
+                if event is None:
+                    event = self.loading[target] = threading.Event()
+                    break
+            event.wait()
+
+        try:
+            model = self.load_model(target)
+            with self.lock:
+                self.models[target] = model
+                while len(self.models) > self.max_models:
+                    self.models.popitem(last=False)
+            return model
+        finally:
+            with self.lock:
+                del self.loading[target]
+            event.set()
+
+    def load_model(self, target):
+        try:
+            import ctranslate2
+            from transformers import AutoTokenizer
+        except ImportError:
+            raise RuntimeError(
+                "The marian-ct2 backend needs the 'ctranslate2', 'transformers' and 'sentencepiece' packages "
+                "(pip install ctranslate2 transformers sentencepiece)."
+            )
+        path = self.model_path(target)
+        if not os.path.isdir(path):
+            raise RuntimeError(
+                f"No local model for {self.source}->{target} in '{path}'. Convert one with: "
+                f"ct2-transformers-converter --model Helsinki-NLP/opus-mt-{self.source}-{target} "
+                f"--output_dir {path} --quantization int8 "
+                f"--copy_files source.spm target.spm vocab.json tokenizer_config.json"
+            )
+        translator = ctranslate2.Translator(
+            path,
+            device="cpu",
+            compute_type=self.compute_type,
+            intra_threads=self.cpu_threads
+        )
+        return translator, AutoTokenizer.from_pretrained(path)
+
+    def translate(self, text, target):
+        return self.translate_batch([text], target)[0]
+
+    def translate_batch(self, texts, target):
+        if target == self.source:
+            return list(texts)
+        translator, tokenizer = self.load(target)
+        tokens = [tokenizer.convert_ids_to_tokens(tokenizer.encode(text)) for text in texts]
+        results = translator.translate_batch(tokens, max_batch_size=self.max_batch_size, beam_size=self.beam_size)
+        return [
+            tokenizer.decode(tokenizer.convert_tokens_to_ids(result.hypotheses[0]), skip_special_tokens=True)
+            for result in results
+        ]
+
+
+BACKENDS = {
+    GoogleBackend.name: GoogleBackend,
+    MarianBackend.name: MarianBackend,
+}
+
+
+def get_backend(name, **options):
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown translation backend '{name}'. Choose from: {', '.join(BACKENDS)}.")
+    return BACKENDS[name](**options)
@@ -0,0 +1,109 @@
+# translation_cache.py
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_CACHE_PATH = os.path.join("cache", "translations.sqlite3")
+
+
+class TranslationCache:
+    def __init__(self, path=DEFAULT_CACHE_PATH, memory_entries=1024, max_entries=100000):
+        self.path = path
+        self.memory_entries = memory_entries
+        self.max_entries = max_entries
+        self.memory = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.db = None
+        self.disk_entries = 0
+
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self.db = sqlite3.connect(path, check_same_thread=False)
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "source TEXT NOT NULL, target TEXT NOT NULL, text TEXT NOT NULL, "
+                "translation TEXT NOT NULL, last_used REAL NOT NULL, "
+                "PRIMARY KEY (source, target, text))"
+            )
+            self.db.execute("CREATE INDEX IF NOT EXISTS translations_last_used ON translations (last_used)")
+            self.db.commit()
+            self.disk_entries = self.db.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def get(self, source, target, text):
+        key = (source, target, text)
+        with self.lock:
+            translation = self.memory.get(key)
+            if translation is not None:
+                self.memory.move_to_end(key)
+                self.hits += 1
+                return translation
+
+            if self.db is not None:
+                row = self.db.execute(
+                    "SELECT translation FROM translations WHERE source = ? AND target = ? AND text = ?", key
+                ).fetchone()
+                if row is not None:
+                    self.db.execute(
+                        "UPDATE translations SET last_used = ? WHERE source = ? AND target = ? AND text = ?",
+                        (time.time(),) + key
+                    )
+                    self.db.commit()
+                    self.remember(key, row[0])
+                    self.hits += 1
+                    return row[0]
+
+            self.misses += 1
+            return None
+
+    def put(self, source, target, text, translation):
+        key = (source, target, text)
+        with self.lock:
+            self.remember(key, translation)
+            if self.db is None:
+                return
+
+            existing = self.db.execute(
+                "SELECT 1 FROM translations WHERE source = ? AND target = ? AND text = ?", key
+            ).fetchone()
+            self.db.execute(
+                "INSERT OR REPLACE INTO translations (source, target, text, translation, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                key + (translation, time.time())
+            )
+            if existing is None:
+                self.disk_entries += 1
+            if self.disk_entries > self.max_entries:
+                self.db.execute(
+                    "DELETE FROM translations WHERE rowid IN "
+                    "(SELECT rowid FROM translations ORDER BY last_used LIMIT ?)",
+                    (self.disk_entries - self.max_entries,)
+                )
+                self.disk_entries = self.max_entries
+            self.db.commit()
+
+    def remember(self, key, translation):
+        self.memory[key] = translation
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+
+    def stats(self):
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "memory_entries": len(self.memory),
+                "disk_entries": self.disk_entries
+            }
+
+    def close(self):
+        with self.lock:
+            if self.db is not None:
+                self.db.close()
+                self.db = None
@@ -0,0 +1,108 @@
+# tts.py
+import wave
+from http_client import get_client
+
+ELEVENLABS_API_URL = "https://api.elevenlabs.io/v1"
+DEFAULT_VOICE_SETTINGS = {
+    "stability": 0.5,
+    "similarity_boost": 0.5
+}
+PCM_SAMPLE_RATE = 22050
+
+
+class ElevenLabsError(Exception):
+    pass
+
+
+class ElevenLabsTTS:
+    def __init__(self, api_key, voice_id, voice_settings=None, base_url=ELEVENLABS_API_URL,
+                 sample_rate=PCM_SAMPLE_RATE, client=None, model_id=None, cache=None):
+        self.api_key = api_key
+        self.voice_id = voice_id
+        self.voice_settings = voice_settings or dict(DEFAULT_VOICE_SETTINGS)
+        self.base_url = base_url
+        self.sample_rate = sample_rate
+        self.client = client or get_client()
+        self.model_id = model_id
+        self.cache = cache
+
+    def build_request(self, text):
+        url = f"{self.base_url}/text-to-speech/{self.voice_id}"
+        headers = {
+            "Accept": "audio/mpeg",
+            "Content-Type": "application/json",
+            "xi-api-key": self.api_key
+        }
+        data = {
+            "text": text,
+            "voice_settings": self.voice_settings
+        }
+        if self.model_id:
+            data["model_id"] = self.model_id
+        return url, headers, data
+
+    def cache_key(self, text, output_format):
+        return self.cache.make_key(self.voice_id, self.model_id, self.voice_settings, output_format, text)
+
+    def synthesize(self, text):
+        key = None
+        if self.cache is not None:
+            key = self.cache_key(text, "mp3")
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        url, headers, data = self.build_request(text)
+        response = self.client.post(url, json=data, headers=headers)
+        if response.status_code != 200:
+            raise ElevenLabsError(f"Failed to generate audio: {response.text}")
+        if key is not None:
+            self.cache.put(key, response.content)
+        return response.content
+
+    def stream(self, text, chunk_size=4096):
+        output_format = f"pcm_{self.sample_rate}"
+        if self.cache is None:
+            yield from self.stream_remote(text, output_format, chunk_size)
+            return
+
+        key = self.cache_key(text, output_format)
+        cached = self.cache.get(key)
+        if cached is not None:
+            for offset in range(0, len(cached), chunk_size):
+                yield cached[offset:offset + chunk_size]
+            return
+
+        audio = bytearray()
+        for chunk in self.stream_remote(text, output_format, chunk_size):
+            audio.extend(chunk)
+            yield chunk
+        self.cache.put(key, bytes(audio))
+
+    def stream_remote(self, text, output_format, chunk_size):
+        url, headers, data = self.build_request(text)
+        headers["Accept"] = "audio/pcm"
+        params = {"output_format": output_format}
+
+        with self.client.stream("POST", f"{url}/stream", json=data, headers=headers, params=params) as response:
+            if response.status_code != 200:
+                raise ElevenLabsError(f"Failed to generate audio: {response.text}")
+
+            # int16 samples can be split across network chunks
+            remainder = b""
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if not chunk:
+                    continue
+                chunk = remainder + chunk
+                usable = len(chunk) - len(chunk) % 2
+                remainder = chunk[usable:]
+                if usable:
+                    yield chunk[:usable]
+
+
+def save_pcm(file_path, pcm, sample_rate, channels=1):
+    with wave.open(file_path, "wb") as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm)
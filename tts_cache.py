@@ -0,0 +1,92 @@
+# tts_cache.py
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+DEFAULT_CACHE_DIR = os.path.join("cache", "tts")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512 MB
+
+
+class AudioCache:
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+        existing = []
+        for name in os.listdir(directory):
+            if not name.endswith(".audio"):
+                continue
+            stat = os.stat(os.path.join(directory, name))
+            existing.append((stat.st_mtime, name[:-len(".audio")], stat.st_size))
+        for _, key, size in sorted(existing):
+            self.entries[key] = size
+            self.total_bytes += size
+
+    @staticmethod
+    def make_key(voice_id, model_id, voice_settings, output_format, text):
+        payload = json.dumps(
+            [voice_id, model_id, voice_settings, output_format, text],
+            sort_keys=True,
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def path_for(self, key):
+        return os.path.join(self.directory, f"{key}.audio")
+
+    def get(self, key):
+        with self.lock:
+            if key not in self.entries:
+                self.misses += 1
+                return None
+            path = self.path_for(key)
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+                os.utime(path)
+            except FileNotFoundError:
+                self.total_bytes -= self.entries.pop(key)
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+        path = self.path_for(key)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+        with self.lock:
+            if key in self.entries:
+                self.total_bytes -= self.entries.pop(key)
+            self.entries[key] = len(data)
+            self.total_bytes += len(data)
+            while self.total_bytes > self.max_bytes and self.entries:
+                old_key, size = self.entries.popitem(last=False)
+                self.total_bytes -= size
+                try:
+                    os.remove(self.path_for(old_key))
+                except FileNotFoundError:
+                    pass
+
+    def stats(self):
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self.entries),
+                "bytes": self.total_bytes
+            }
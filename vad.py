@@ -0,0 +1,148 @@
+# vad.py
+from collections import deque
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+
+def frame_energies(audio, frame_length):
+    frame_count = len(audio) // frame_length
+    if frame_count == 0:
+        return np.zeros(0, dtype=np.float32)
+    frames = np.asarray(audio[:frame_count * frame_length], dtype=np.float32).reshape(frame_count, frame_length)
+    if np.issubdtype(np.asarray(audio).dtype, np.integer):
+        frames = frames / 32768.0
+    rms = np.sqrt(np.mean(frames * frames, axis=1) + 1e-12)
+    return 20 * np.log10(rms)
+
+
+def speech_frames(energies, threshold_db=None, margin_db=12.0, floor_db=-55.0):
+    if len(energies) == 0:
+        return np.zeros(0, dtype=bool)
+    if threshold_db is None:
+        # between the quietest and loudest frames, so all-speech or all-silence input still works
+        noise_floor = np.percentile(energies, 5)
+        peak = np.percentile(energies, 95)
+        threshold_db = max(min(noise_floor + margin_db, peak - margin_db), floor_db)
+    return energies > threshold_db
+
+
+def split_on_silence(audio, sample_rate=SAMPLE_RATE, frame_ms=30, min_silence_ms=500,
+                     max_window_s=30.0, padding_ms=200, threshold_db=None):
+    frame_length = int(sample_rate * frame_ms / 1000)
+    speech = speech_frames(frame_energies(audio, frame_length), threshold_db)
+    if not speech.any():
+        return []
+
+    # bridge pauses shorter than min_silence_ms so sentences stay in one window
+    min_silence_frames = max(1, min_silence_ms // frame_ms)
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], speech.astype(np.int8), [0]))))
+    regions = [[start, end] for start, end in zip(edges[::2], edges[1::2])]
+    merged = [regions[0]]
+    for start, end in regions[1:]:
+        if start - merged[-1][1] < min_silence_frames:
+            merged[-1][1] = end
+        else:
+            merged.append([start, end])
+
+    padding = int(sample_rate * padding_ms / 1000)
+    max_window = int(sample_rate * max_window_s)
+    windows = []
+    for start, end in merged:
+        start_sample = max(0, int(start) * frame_length - padding)
+        end_sample = min(len(audio), int(end) * frame_length + padding)
+        while end_sample - start_sample > max_window:
+            windows.append((start_sample, start_sample + max_window))
+            start_sample += max_window
+        windows.append((start_sample, end_sample))
+    return windows
+
+
+class VadGate:
+    def __init__(self, sample_rate=SAMPLE_RATE, frame_ms=30, threshold_db=None, margin_db=12.0,
+                 floor_db=-50.0, hangover_ms=300, endpoint_ms=600, preroll_ms=210):
+        self.frame_length = int(sample_rate * frame_ms / 1000)
+        self.threshold_db = threshold_db
+        self.margin_db = margin_db
+        self.floor_db = floor_db
+        self.hangover_frames = max(1, hangover_ms // frame_ms)
+        self.endpoint_frames = max(self.hangover_frames + 1, endpoint_ms // frame_ms)
+        self.preroll = deque(maxlen=max(1, preroll_ms // frame_ms))
+        self.noise_floor = None
+        self.remainder = np.zeros(0, dtype=np.int16)
+        self.in_speech = False
+        self.silent_run = 0
+        self.total_frames = 0
+        self.kept_frames = 0
+
+    def reset(self):
+        self.preroll.clear()
+        self.remainder = np.zeros(0, dtype=np.int16)
+        self.in_speech = False
+        self.silent_run = 0
+
+    def classify(self, energies):
+        if self.threshold_db is not None:
+            return energies > self.threshold_db
+        if self.noise_floor is None:
+            self.noise_floor = float(energies.min())
+
+        speech = energies > max(self.noise_floor + self.margin_db, self.floor_db)
+        # drop to quieter frames immediately, rise slowly with the background level
+        quiet = energies[~speech]
+        if len(quiet):
+            self.noise_floor = 0.95 * self.noise_floor + 0.05 * float(quiet.mean())
+        self.noise_floor = min(self.noise_floor, float(energies.min()))
+        return speech
+
+    def process(self, block):
+        if isinstance(block, (bytes, bytearray, memoryview)):
+            samples = np.frombuffer(block, dtype=np.int16)
+        else:
+            samples = np.asarray(block, dtype=np.int16).reshape(-1)
+        if len(self.remainder):
+            samples = np.concatenate((self.remainder, samples))
+
+        frame_count = len(samples) // self.frame_length
+        self.remainder = samples[frame_count * self.frame_length:].copy()
+        if frame_count == 0:
+            return None, False
+
+        frames = samples[:frame_count * self.frame_length].reshape(frame_count, self.frame_length)
+        speech = self.classify(frame_energies(frames.reshape(-1), self.frame_length))
+
+        kept = []
+        endpoint = False
+        for frame, is_speech in zip(frames, speech):
+            if is_speech:
+                if not self.in_speech:
+                    kept.extend(self.preroll)
+                    self.preroll.clear()
+                self.in_speech = True
+                self.silent_run = 0
+                kept.append(frame)
+                continue
+
+            self.silent_run += 1
+            if self.in_speech and self.silent_run <= self.hangover_frames:
+                kept.append(frame)
+            else:
+                # the caller may reuse its buffer before these frames are sent
+                self.preroll.append(frame.copy())
+            if self.in_speech and self.silent_run >= self.endpoint_frames:
+                self.in_speech = False
+                endpoint = True
+
+        self.total_frames += frame_count
+        self.kept_frames += len(kept)
+        if not kept:
+            return None, endpoint
+        return np.concatenate(kept), endpoint
+
+    def stats(self):
+        dropped = max(0, self.total_frames - self.kept_frames)
+        return {
+            "total_frames": self.total_frames,
+            "kept_frames": self.kept_frames,
+            "dropped_ratio": dropped / self.total_frames if self.total_frames else 0.0
+        }
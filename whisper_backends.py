@@ -0,0 +1,93 @@
+# whisper_backends.py
+import os
+
+DEFAULT_BACKEND = "openai-whisper"
+
+
+class OpenAIWhisperBackend:
+    name = "openai-whisper"
+
+    def __init__(self, cpu_threads=None):
+        self.cpu_threads = cpu_threads
+
+    def load(self, model_name):
+        import torch
+        import whisper
+        if self.cpu_threads:
+            torch.set_num_threads(self.cpu_threads)
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        return whisper.load_model(model_name, device=device)
+
+
+class QuantizedWhisperBackend:
+    name = "whisper-int8"
+
+    def __init__(self, cpu_threads=None):
+        self.cpu_threads = cpu_threads
+
+    def load(self, model_name):
+        import torch
+        import whisper
+        if self.cpu_threads:
+            torch.set_num_threads(self.cpu_threads)
+        model = whisper.load_model(model_name, device="cpu")
+        # whisper subclasses nn.Linear only to cast dtypes; plain Linear lets quantize_dynamic swap it
+        for module in model.modules():
+            if isinstance(module, torch.nn.Linear) and type(module) is not torch.nn.Linear:
+                module.__class__ = torch.nn.Linear
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+class FasterWhisperBackend:
+    name = "faster-whisper"
+
+    def __init__(self, compute_type="int8", cpu_threads=None):
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads or os.cpu_count() or 4
+
+    def load(self, model_name):
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            raise RuntimeError("The faster-whisper backend needs the 'faster-whisper' package (pip install faster-whisper).")
+        model = WhisperModel(
+            model_name,
+            device="cpu",
+            compute_type=self.compute_type,
+            cpu_threads=self.cpu_threads
+        )
+        return FasterWhisperModel(model)
+
+
+class FasterWhisperModel:
+    def __init__(self, model):
+        self.model = model
+
+    def transcribe(self, audio, **kwargs):
+        segments, info = self.model.transcribe(
+            audio,
+            beam_size=kwargs.get("beam_size", 5),
+            language=kwargs.get("language")
+        )
+        segments = [
+            {"start": segment.start, "end": segment.end, "text": segment.text}
+            for segment in segments
+        ]
+        return {
+            "text": "".join(segment["text"] for segment in segments),
+            "segments": segments,
+            "language": info.language
+        }
+
+
+BACKENDS = {
+    OpenAIWhisperBackend.name: OpenAIWhisperBackend,
+    QuantizedWhisperBackend.name: QuantizedWhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend,
+}
+
+
+def get_backend(name, **options):
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown Whisper backend '{name}'. Choose from: {', '.join(BACKENDS)}.")
+    return BACKENDS[name](**options)
@@ -1,27 +1,38 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 import threading
+import queue
 import os
-import sounddevice as sd
-import soundfile as sf
-import whisper
-from deep_translator import GoogleTranslator
-import requests
+from translation import Translator, get_google_translate_languages, parse_targets
+import translation_backends
+from translation_cache import TranslationCache
+from tts_cache import AudioCache
+from tts import ElevenLabsTTS, PCM_SAMPLE_RATE
+from playback import StreamPlayer
+from concurrent.futures import ThreadPoolExecutor
+from asr import WhisperASR, StreamingWhisperASR
+from pipeline import SpeechPipeline, FanOutTarget
+from dispatcher import TkDispatcher
+from session_store import SessionStore
+from audio_grid import AudioGrid
+from text_renderer import TextRenderer
+from latency import LatencyTracker
+from latency_view import LatencyWindow
+from vad import VadGate
+from audio_capture import AudioCapture
+from recording_buffer import RecordingBuffer
+from whisper_loader import WhisperModelLoader
+from whisper_backends import BACKENDS, DEFAULT_BACKEND
 import time
-import torch
-import numpy as np
 import ttkbootstrap as ttk
 
 class WhisperCloneApp:
-    def __init__(self, parent, root):
+    def __init__(self, parent, root, session=None, translation_cache=None, audio_cache=None):
         self.parent = parent
         self.root = root
 
         self.style = ttk.Style(theme="solar")
 
-        self.cuda_available = torch.cuda.is_available()
-        self.device = "cuda" if self.cuda_available else "cpu"
-
         self.whisper_models = {
             "tiny": "tiny",
             "base": "base",
@@ -30,7 +41,12 @@ class WhisperCloneApp:
             "large": "large"
         }
         self.whisper_model_var = tk.StringVar(value="base")
-        self.whisper_model = whisper.load_model(self.whisper_model_var.get()).to(self.device)
+        self.whisper_backend_var = tk.StringVar(value=DEFAULT_BACKEND)
+        self.whisper_model = None
+        self.whisper_loader = WhisperModelLoader()
+        self.whisper_model_requested = False
+        self.whisper_status_var = tk.StringVar(value="Not loaded")
+        self.streaming_var = tk.BooleanVar(value=True)
 
         self.input_audio_folder = "whisper_input_audio"
         if not os.path.exists(self.input_audio_folder):
@@ -38,13 +54,32 @@ class WhisperCloneApp:
 
         self.translation_language_var = tk.StringVar(value="English")
         self.translation_languages = self.get_google_translate_languages()
+        self.broadcast_languages_var = tk.StringVar()
+        self.translation_backend_var = tk.StringVar(value=translation_backends.DEFAULT_BACKEND)
+        self.source_language_var = tk.StringVar(value="Auto-detect")
+        # one cache per process; separate instances on the same file would each count only their own entries
+        self.translator = Translator(cache=translation_cache or TranslationCache())
+        self.audio_cache = audio_cache or AudioCache()
+        self.latency_var = tk.StringVar(value="Latency: -")
+        self.latency = LatencyTracker(log_path=os.path.join("logs", "latency.jsonl"))
+
+        self.dispatcher = TkDispatcher(self.root)
+        self.stream_player = StreamPlayer(PCM_SAMPLE_RATE, on_error=self.dispatcher.wrap(self.playback_failed))
+        self.file_writer = ThreadPoolExecutor(max_workers=1)
+        self.pipeline = SpeechPipeline(
+            translator=self.translator,
+            on_event=self.dispatcher.wrap(self.handle_pipeline_event),
+            on_error=self.dispatcher.wrap(self.handle_pipeline_error),
+            latency=self.latency
+        )
+        self.pipeline.start()
         self.elevenlabs_api_key = tk.StringVar()
         self.elevenlabs_voice_id = tk.StringVar()
-        self.audio_files = []
+        # both tabs share one store so clip offsets into the audio archive stay consistent
+        self.session = session or SessionStore()
+        self.scrollback_lines = 1000
 
         self.sequential_playback_active = False
-        self.sequential_playback_thread = None
-        self.stop_sequential_playback = threading.Event()
 
         self.is_recording = False
         self.recording_thread = None
@@ -52,10 +87,10 @@ class WhisperCloneApp:
         self.fs = 16000
 
         self.setup_gui()
+        self.restore_history()
 
     def get_google_translate_languages(self):
-        languages = GoogleTranslator().get_supported_languages(as_dict=True)
-        return {lang.capitalize(): code for lang, code in languages.items()}
+        return get_google_translate_languages()
 
     def setup_gui(self):
         self.parent.grid_rowconfigure(0, weight=0)
@@ -91,22 +126,87 @@ class WhisperCloneApp:
         self.model_combo.grid(column=1, row=2, padx=10, pady=2, sticky='w')
         self.model_combo.bind("<<ComboboxSelected>>", self.update_whisper_model)
 
+        self.backend_combo = ttk.Combobox(self.parent, textvariable=self.whisper_backend_var, state="readonly")
+        self.backend_combo['values'] = list(BACKENDS.keys())
+        self.backend_combo.grid(column=2, row=2, padx=10, pady=2, sticky='w')
+        self.backend_combo.bind("<<ComboboxSelected>>", self.update_whisper_model)
+
+        whisper_status_label = ttk.Label(self.parent, textvariable=self.whisper_status_var)
+        whisper_status_label.grid(column=2, row=1, padx=10, pady=2, sticky='e')
+
         upload_button = ttk.Button(self.parent, text="Upload Audio", command=self.upload_audio)
         upload_button.grid(column=0, row=3, padx=10, pady=5, sticky='w')
 
         self.record_button = ttk.Button(self.parent, text="Start Recording", command=self.toggle_recording)
         self.record_button.grid(column=1, row=3, padx=10, pady=5, sticky='w')
 
-        clear_button = ttk.Button(self.parent, text="Clear Transcription", command=self.clear_transcription)
-        clear_button.grid(column=2, row=3, padx=10, pady=5, sticky='w')
+        transcription_options = ttk.Frame(self.parent)
+        transcription_options.grid(column=2, row=3, padx=10, pady=5, sticky='w')
+
+        clear_button = ttk.Button(transcription_options, text="Clear Transcription", command=self.clear_transcription)
+        clear_button.grid(column=0, row=0, sticky='w')
+
+        streaming_check = ttk.Checkbutton(
+            transcription_options,
+            text="Stream segments",
+            variable=self.streaming_var,
+            command=self.update_whisper_asr
+        )
+        streaming_check.grid(column=1, row=0, padx=10, sticky='w')
+
+        self.source_language_combo = ttk.Combobox(
+            transcription_options, textvariable=self.source_language_var, state="readonly", width=14
+        )
+        self.source_language_combo['values'] = ["Auto-detect"] + list(self.translation_languages.keys())
+        self.source_language_combo.grid(column=2, row=0, sticky='w')
+        self.source_language_combo.bind("<<ComboboxSelected>>", self.update_translation_backend)
 
         self.transcription_area = scrolledtext.ScrolledText(self.parent, wrap=tk.WORD, state='disabled')
+        self.transcription_renderer = TextRenderer(
+            self.root, self.transcription_area, self.dispatcher, max_lines=self.scrollback_lines,
+            on_trim=lambda lines: self.session.archive_lines("whisper", "transcription", lines)
+        )
         self.transcription_area.grid(column=0, row=4, columnspan=3, padx=10, pady=5, sticky='nsew')
 
+    def ensure_whisper_model(self):
+        # whisper and torch are imported on first use, not while the app starts
+        if not self.whisper_model_requested:
+            self.update_whisper_model()
+
     def update_whisper_model(self, event=None):
+        self.whisper_model_requested = True
         selected_model = self.whisper_model_var.get()
-        self.whisper_model = whisper.load_model(selected_model).to(self.device)
-        messagebox.showinfo("Model Updated", f"Whisper model changed to {selected_model}.")
+        selected_backend = self.whisper_backend_var.get()
+        self.whisper_status_var.set(f"Loading {selected_model} ({selected_backend})...")
+        self.whisper_loader.load_async(
+            selected_model,
+            on_ready=self.dispatcher.wrap(self.whisper_model_ready),
+            on_error=self.dispatcher.wrap(self.whisper_model_failed),
+            backend=selected_backend
+        )
+
+    def is_selected_whisper_model(self, name, backend):
+        return name == self.whisper_model_var.get() and backend == self.whisper_backend_var.get()
+
+    def whisper_model_ready(self, name, backend, model):
+        if not self.is_selected_whisper_model(name, backend):
+            return
+        self.whisper_model = model
+        self.update_whisper_asr()
+        self.whisper_status_var.set(f"{name} ({backend}) ready")
+
+    def update_whisper_asr(self):
+        if self.whisper_model is None:
+            return
+        if self.streaming_var.get():
+            self.pipeline.asr = StreamingWhisperASR(self.whisper_model)
+        else:
+            self.pipeline.asr = WhisperASR(self.whisper_model)
+
+    def whisper_model_failed(self, name, backend, error):
+        if self.is_selected_whisper_model(name, backend):
+            self.whisper_status_var.set(f"{name} ({backend}) failed to load")
+        messagebox.showerror("Error", f"Failed to load Whisper model '{name}' ({backend}): {error}")
 
     def setup_translation_section(self):
         translation_label = ttk.Label(self.parent, text="Translation Controls", font=("Helvetica", 14, "bold"))
@@ -119,10 +219,26 @@ class WhisperCloneApp:
         self.translation_language_combo['values'] = list(self.translation_languages.keys())
         self.translation_language_combo.grid(column=4, row=2, padx=10, pady=2, sticky='w')
 
+        self.translation_backend_combo = ttk.Combobox(self.parent, textvariable=self.translation_backend_var, state="readonly")
+        self.translation_backend_combo['values'] = list(translation_backends.BACKENDS.keys())
+        self.translation_backend_combo.grid(column=5, row=2, padx=10, pady=2, sticky='w')
+        self.translation_backend_combo.bind("<<ComboboxSelected>>", self.update_translation_backend)
+
         clear_translation_button = ttk.Button(self.parent, text="Clear Translation", command=self.clear_translation)
         clear_translation_button.grid(column=3, row=3, padx=10, pady=2, sticky='w')
 
+        broadcast_label = ttk.Label(self.parent, text="Also Translate To:")
+        broadcast_label.grid(column=4, row=3, padx=10, pady=2, sticky='w')
+
+        # comma separated languages, each optionally followed by :voice_id
+        self.broadcast_entry = ttk.Entry(self.parent, textvariable=self.broadcast_languages_var, width=30)
+        self.broadcast_entry.grid(column=5, row=3, padx=10, pady=2, sticky='w')
+
         self.translation_area = scrolledtext.ScrolledText(self.parent, wrap=tk.WORD, state='disabled')
+        self.translation_renderer = TextRenderer(
+            self.root, self.translation_area, self.dispatcher, max_lines=self.scrollback_lines,
+            on_trim=lambda lines: self.session.archive_lines("whisper", "translation", lines)
+        )
         self.translation_area.grid(column=3, row=4, columnspan=3, padx=10, pady=5, sticky='nsew')
 
     def setup_elevenlabs_section(self):
@@ -141,15 +257,33 @@ class WhisperCloneApp:
         self.voice_id_entry = ttk.Entry(self.parent, textvariable=self.elevenlabs_voice_id, width=30)
         self.voice_id_entry.grid(column=3, row=6, padx=10, pady=2, sticky='w')
 
-        self.audio_grid_frame = ttk.Frame(self.parent)
-        self.audio_grid_frame.grid(column=0, row=7, columnspan=6, padx=10, pady=5, sticky='nsew')
+        self.audio_grid = AudioGrid(
+            self.parent,
+            self.session,
+            "whisper",
+            on_play=self.play_audio_clip,
+            actions=[("X", self.delete_audio_clip), ("Download", self.download_audio_clip)]
+        )
+        self.audio_grid.grid(column=0, row=7, columnspan=6, padx=10, pady=5, sticky='nsew')
+
+        playback_controls = ttk.Frame(self.parent)
+        playback_controls.grid(column=0, row=8, padx=10, pady=10, sticky='w')
 
         self.sequential_playback_button = ttk.Button(
-            self.parent,
+            playback_controls,
             text="Play All Sequentially (Off)",
             command=self.toggle_sequential_playback
         )
-        self.sequential_playback_button.grid(column=0, row=8, padx=10, pady=10, sticky='w')
+        self.sequential_playback_button.grid(column=0, row=0, sticky='w')
+
+        skip_button = ttk.Button(playback_controls, text="Skip", command=self.skip_playback)
+        skip_button.grid(column=1, row=0, padx=(5, 0), sticky='w')
+
+        latency_label = ttk.Label(self.parent, textvariable=self.latency_var)
+        latency_label.grid(column=1, row=8, columnspan=4, padx=10, pady=10, sticky='w')
+
+        latency_button = ttk.Button(self.parent, text="Latency Stats", command=self.show_latency_window)
+        latency_button.grid(column=5, row=8, padx=10, pady=10, sticky='e')
 
     def toggle_recording(self):
         if self.is_recording:
@@ -159,35 +293,56 @@ class WhisperCloneApp:
         else:
             self.is_recording = True
             self.record_button.config(text="Stop Recording")
-            self.recording_data = []
+            timestamp = time.strftime("%Y%m%d-%H%M%S")
+            file_path = os.path.join(self.input_audio_folder, f"recording_{timestamp}.wav")
+            self.recording_data = RecordingBuffer(self.fs, spill_path=file_path)
             self.recording_thread = threading.Thread(target=self.record_audio)
             self.recording_thread.start()
             messagebox.showinfo("Recording", "Recording started. Speak now.")
 
     def record_audio(self):
-        def callback(indata, frames, time, status):
-            if self.is_recording:
-                self.recording_data.append(indata.copy())
-            else:
-                raise sd.CallbackStop()
+        vad = VadGate(self.fs)
 
         try:
-            with sd.InputStream(samplerate=self.fs, channels=1, dtype='int16', callback=callback):
+            # the audio callback only fills the ring; VAD and buffer growth happen on this thread
+            capture = AudioCapture(samplerate=self.fs, blocksize=self.fs // 10)
+            with capture:
                 while self.is_recording:
-                    sd.sleep(100)
-
-            if self.recording_data:
-                recording = np.concatenate(self.recording_data)
-                timestamp = time.strftime("%Y%m%d-%H%M%S")
-                file_path = os.path.join(self.input_audio_folder, f"recording_{timestamp}.wav")
-                sf.write(file_path, recording, self.fs)
-                messagebox.showinfo("Recording", f"Recording saved as '{file_path}'.")
-                self.transcribe_audio(file_path)
+                    self.record_block(capture, vad, timeout=0.1)
+            # blocks still in the ring when the stream stopped
+            while self.record_block(capture, vad, timeout=0):
+                pass
+
+            if len(self.recording_data):
+                recording = self.recording_data.to_float32()
+                self.dispatcher.post(self.transcribe_audio, recording)
+                future = self.file_writer.submit(self.recording_data.save, self.recording_data.spill_path)
+                future.add_done_callback(self.dispatcher.wrap(self.recording_saved))
             else:
                 messagebox.showwarning("Warning", "No audio data recorded.")
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred during recording: {e}")
 
+    def record_block(self, capture, vad, timeout):
+        block = capture.read(timeout=timeout)
+        if block is None:
+            return False
+        try:
+            speech, _ = vad.process(block)
+            if speech is not None:
+                self.recording_data.append(speech)
+        finally:
+            capture.release()
+        return True
+
+    def recording_saved(self, future):
+        try:
+            file_path = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save recording: {e}")
+            return
+        messagebox.showinfo("Recording", f"Recording saved as '{file_path}'.")
+
     def upload_audio(self):
         file_path = filedialog.askopenfilename(
             title="Select Audio File",
@@ -196,115 +351,189 @@ class WhisperCloneApp:
         if file_path:
             self.transcribe_audio(file_path)
 
-    def transcribe_audio(self, file_path):
-        try:
-            result = self.whisper_model.transcribe(file_path)
-            transcription_text = result["text"]
-
-            self.transcription_area.configure(state='normal')
-            self.transcription_area.insert(tk.END, f"Transcription:\n{transcription_text}\n\n")
-            self.transcription_area.configure(state='disabled')
-            self.transcription_area.see(tk.END)
-
-            self.translate_text(transcription_text)
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred during transcription: {e}")
+    def transcribe_audio(self, audio):
+        if self.pipeline.asr is None:
+            self.ensure_whisper_model()
+            messagebox.showinfo("Info", "The Whisper model is still loading. Please try again in a moment.")
+            return
 
-    def translate_text(self, text):
+        selected_language_name = self.translation_language_var.get()
+        self.pipeline.target = self.translation_languages.get(selected_language_name.capitalize(), "en")
+        self.pipeline.tts = self.get_elevenlabs_tts()
+        self.pipeline.targets = self.get_broadcast_targets(self.pipeline.target)
         try:
-            selected_language_name = self.translation_language_var.get()
-            target_language = self.translation_languages.get(selected_language_name.capitalize(), "en")
-            translator = GoogleTranslator(source='auto', target=target_language)
-            translated_text = translator.translate(text)
-            self.translation_area.configure(state='normal')
-            self.translation_area.insert(tk.END, f"{translated_text}\n")
-            self.translation_area.configure(state='disabled')
-            self.translation_area.see(tk.END)
-            self.generate_elevenlabs_audio(translated_text)
+            self.pipeline.feed_audio(audio, timeout=0)
+        except queue.Full:
+            messagebox.showwarning("Warning", "Transcription is still busy with earlier audio; please try again shortly.")
+
+    def update_translation_backend(self, event=None):
+        name = self.translation_backend_var.get()
+        source = self.translation_languages.get(self.source_language_var.get(), "auto")
+        if name != translation_backends.DEFAULT_BACKEND and source == "auto":
+            # local models are trained per language pair and cannot detect the spoken language
+            messagebox.showerror("Translation Error", f"The {name} engine needs the spoken language; choose it instead of Auto-detect.")
+            name = translation_backends.DEFAULT_BACKEND
+            self.translation_backend_var.set(name)
+        backend = translation_backends.get_backend(name, source=source)
+        self.translator.backend = backend
+        load = getattr(backend, "load", None)
+        if load is not None:
+            target = self.translation_languages.get(self.translation_language_var.get().capitalize(), "en")
+            threading.Thread(target=self.warm_translation_backend, args=(load, target), daemon=True).start()
+
+    def warm_translation_backend(self, load, target):
+        # load the model now so the first utterance does not pay for it
+        try:
+            load(target)
         except Exception as e:
-            messagebox.showerror("Translation Error", f"An error occurred during translation: {e}")
+            self.dispatcher.post(messagebox.showerror, "Translation Error", f"Failed to load the translation model: {e}")
 
-    def generate_elevenlabs_audio(self, text):
+    def get_elevenlabs_tts(self):
         api_key = self.elevenlabs_api_key.get()
         voice_id = self.elevenlabs_voice_id.get()
 
         if not api_key or not voice_id:
             messagebox.showwarning("Warning", "Please enter your 11labs API key and voice ID.")
-            return
-
-        url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
-        headers = {
-            "Accept": "audio/mpeg",
-            "Content-Type": "application/json",
-            "xi-api-key": api_key
-        }
-        data = {
-            "text": text,
-            "voice_settings": {
-                "stability": 0.5,
-                "similarity_boost": 0.5
-            }
-        }
-
-        try:
-            response = requests.post(url, json=data, headers=headers)
-            if response.status_code == 200:
-                audio_file = f"output_{len(self.audio_files) + 1}.mp3"
-                with open(audio_file, "wb") as f:
-                    f.write(response.content)
-                self.audio_files.append(audio_file)
-                self.update_audio_grid()
-
-                if self.sequential_playback_active:
-                    self.play_audio_file(audio_file)
-            else:
-                messagebox.showerror("Error", f"Failed to generate audio: {response.text}")
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred while generating audio: {e}")
+            return None
+        return ElevenLabsTTS(api_key, voice_id, cache=self.audio_cache)
+
+    def get_broadcast_targets(self, target_language):
+        # every extra language is translated and voiced alongside the selected one
+        extra = parse_targets(self.broadcast_languages_var.get(), self.translation_languages)
+        if not extra:
+            return None
+        api_key = self.elevenlabs_api_key.get()
+        targets = [FanOutTarget(target_language, self.pipeline.tts, self.pipeline.player)]
+        for language, voice_id in extra:
+            if language == target_language:
+                continue
+            voice_id = voice_id or self.elevenlabs_voice_id.get()
+            tts = ElevenLabsTTS(api_key, voice_id, cache=self.audio_cache) if api_key and voice_id else None
+            targets.append(FanOutTarget(language, tts))
+        return targets
+
+    def handle_pipeline_event(self, event, utterance):
+        if event == "transcribed":
+            self.show_transcription(utterance)
+        elif event == "translated":
+            self.show_translation(utterance)
+        elif event == "synthesized":
+            self.add_generated_audio(utterance)
+
+    def handle_pipeline_error(self, stage, item, error):
+        if stage == "asr":
+            messagebox.showerror("Error", f"An error occurred during transcription: {error}")
+        elif stage == "translate":
+            messagebox.showerror("Translation Error", f"An error occurred during translation: {error}")
+        else:
+            messagebox.showerror("Error", f"An error occurred while generating audio: {error}")
+
+    def restore_history(self):
+        # a broadcast utterance has one row per language but is shown as spoken once
+        spoken = set()
+        for text, translation, target, broadcast_id in self.session.recent_utterances("whisper", self.scrollback_lines):
+            if broadcast_id is None or broadcast_id not in spoken:
+                spoken.add(broadcast_id)
+                self.transcription_renderer.append(text)
+            if translation:
+                self.translation_renderer.append(self.format_translation(translation, target, broadcast_id))
+
+    def show_transcription(self, utterance):
+        if utterance.start is None:
+            self.transcription_renderer.append(f"Transcription:\n{utterance.text}\n")
+        else:
+            minutes, seconds = divmod(int(utterance.start), 60)
+            self.transcription_renderer.append(f"[{minutes:02d}:{seconds:02d}] {utterance.text}")
 
-    def update_audio_grid(self):
-        for widget in self.audio_grid_frame.winfo_children():
-            widget.destroy()
+    def show_translation(self, utterance):
+        utterance.record_id = self.session.record_utterance("whisper", utterance)
+        self.translation_renderer.append(
+            self.format_translation(utterance.translation, utterance.target, utterance.broadcast_id)
+        )
+        self.update_latency_label(utterance)
 
-        for i, audio_file in enumerate(self.audio_files):
-            audio_frame = ttk.Frame(self.audio_grid_frame)
-            audio_frame.grid(row=i // 2, column=i % 2, padx=5, pady=5, sticky='nsew')
+    def format_translation(self, translation, target, broadcast_id):
+        if broadcast_id is None:
+            return translation
+        return f"[{target}] {translation}"
 
-            play_button = ttk.Button(audio_frame, text=f"Play {i + 1}", command=lambda f=audio_file: self.play_audio_file(f))
-            play_button.grid(row=0, column=0, padx=5, pady=5, sticky='nsew')
+    def add_generated_audio(self, utterance):
+        future = self.file_writer.submit(self.session.add_clip, "whisper", utterance.audio, utterance.sample_rate, utterance)
+        future.add_done_callback(lambda f: self.dispatcher.post(self.audio_clip_saved, utterance, f))
+        self.update_latency_label(utterance)
 
-            delete_button = ttk.Button(audio_frame, text="X", command=lambda f=audio_file: self.delete_audio_file(f))
-            delete_button.grid(row=0, column=1, padx=5, pady=5, sticky='nsew')
+    def audio_clip_saved(self, utterance, future):
+        try:
+            clip_id = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"An error occurred while saving the generated audio: {e}")
+            return
 
-            download_button = ttk.Button(audio_frame, text="Download", command=lambda f=audio_file: self.download_audio_file(f))
-            download_button.grid(row=0, column=2, padx=5, pady=5, sticky='nsew')
+        self.audio_grid.add(clip_id, utterance.target)
+        if self.sequential_playback_active and not utterance.played and utterance.broadcast_id is None:
+            self.stream_player.play_file(
+                self.session.clip_source(clip_id),
+                on_start=lambda: self.pipeline.playback_started(utterance)
+            )
 
-    def delete_audio_file(self, file_path):
+    def update_latency_label(self, utterance):
+        parts = []
+        translate_latency = utterance.latency("asr_final", "translated")
+        if translate_latency is not None:
+            parts.append(f"translate {translate_latency:.2f}s")
+        first_audio_latency = utterance.latency("translated", "tts_first_byte")
+        if first_audio_latency is not None:
+            parts.append(f"first audio {first_audio_latency:.2f}s")
+        tts_latency = utterance.latency("translated", "tts_complete")
+        if tts_latency is not None:
+            parts.append(f"11labs {tts_latency:.2f}s")
+        total_latency = utterance.latency("asr_final", "tts_complete")
+        if total_latency is not None:
+            parts.append(f"total {total_latency:.2f}s")
+        end_to_end = self.latency.summary()["end_to_end"]
+        if end_to_end["count"]:
+            parts.append(f"p95 end-to-end {end_to_end['p95']:.2f}s")
+        cache_stats = self.translator.cache.stats()
+        lookups = cache_stats["hits"] + cache_stats["misses"]
+        if lookups:
+            parts.append(f"cache hits {cache_stats['hits']}/{lookups}")
+        audio_cache_stats = self.audio_cache.stats()
+        audio_lookups = audio_cache_stats["hits"] + audio_cache_stats["misses"]
+        if audio_lookups:
+            parts.append(f"11labs cache hits {audio_cache_stats['hits']}/{audio_lookups}")
+        self.latency_var.set("Latency: " + " | ".join(parts))
+
+    def show_latency_window(self):
+        LatencyWindow(self.root, self.latency)
+
+    def delete_audio_clip(self, clip_id):
         try:
-            os.remove(file_path)
-            self.audio_files.remove(file_path)
-            self.update_audio_grid()
+            self.session.remove_clip(clip_id)
+            self.audio_grid.remove(clip_id)
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred while deleting the audio file: {e}")
 
-    def play_audio_file(self, file_path):
-        try:
-            data, fs = sf.read(file_path, dtype='int16')
-            sd.play(data, fs)
-            sd.wait()
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred during playback: {e}")
+    def play_audio_clip(self, clip_id):
+        # a clicked clip replaces whatever is playing or queued
+        self.stream_player.cancel()
+        self.stream_player.play_file(self.session.clip_source(clip_id))
+
+    def playback_failed(self, source, error):
+        messagebox.showerror("Error", f"An error occurred during playback: {error}")
 
-    def download_audio_file(self, file_path):
+    def skip_playback(self):
+        self.stream_player.skip()
+
+    def download_audio_clip(self, clip_id):
         try:
             save_path = filedialog.asksaveasfilename(
-                defaultextension=".mp3",
-                filetypes=[("MP3 Files", "*.mp3")],
+                defaultextension=".wav",
+                initialfile=f"output_{clip_id}.wav",
+                filetypes=[("Audio Files", "*.wav")],
                 title="Save Audio File"
             )
             if save_path:
-                import shutil
-                shutil.copy(file_path, save_path)
+                self.session.export_clip(clip_id, save_path)
                 messagebox.showinfo("Success", f"Audio file saved as {save_path}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save audio file: {e}")
@@ -312,41 +541,22 @@ class WhisperCloneApp:
     def toggle_sequential_playback(self):
         if self.sequential_playback_active:
             self.sequential_playback_active = False
-            self.stop_sequential_playback.set()
+            self.pipeline.player = None
+            self.stream_player.cancel()
             self.sequential_playback_button.config(text="Play All Sequentially (Off)")
         else:
             self.sequential_playback_active = True
-            self.stop_sequential_playback.clear()
+            self.pipeline.player = self.stream_player
             self.sequential_playback_button.config(text="Play All Sequentially (On)")
-
-            if self.audio_files:
-                self.play_all_sequentially()
+            self.play_all_sequentially()
 
     def play_all_sequentially(self):
-        if not self.sequential_playback_active:
-            return
-
-        def play_next(index):
-            if index < len(self.audio_files) and self.sequential_playback_active:
-                file_path = self.audio_files[index]
-                try:
-                    data, fs = sf.read(file_path, dtype='int16')
-                    sd.play(data, fs)
-                    sd.wait()
-                    self.root.after(0, lambda: play_next(index + 1))
-                except Exception as e:
-                    messagebox.showerror("Error", f"An error occurred during playback: {e}")
-            elif index >= len(self.audio_files):
-                self.root.after(1000, lambda: play_next(index))
-
-        play_next(0)
+        # queued back to back on the one output stream; new clips stream in as they are synthesized
+        for clip_id in self.session.clip_ids("whisper"):
+            self.stream_player.play_file(self.session.clip_source(clip_id))
 
     def clear_transcription(self):
-        self.transcription_area.configure(state='normal')
-        self.transcription_area.delete('1.0', tk.END)
-        self.transcription_area.configure(state='disabled')
+        self.transcription_renderer.clear()
 
     def clear_translation(self):
-        self.translation_area.configure(state='normal')
-        self.translation_area.delete('1.0', tk.END)
-        self.translation_area.configure(state='disabled')
\ No newline at end of file
+        self.translation_renderer.clear()
\ No newline at end of file
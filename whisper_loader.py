@@ -0,0 +1,45 @@
+# whisper_loader.py
+import threading
+from collections import OrderedDict
+from whisper_backends import DEFAULT_BACKEND, get_backend
+
+
+class WhisperModelLoader:
+    def __init__(self, max_models=2):
+        self.max_models = max_models
+        self.models = OrderedDict()
+        self.lock = threading.Lock()
+
+    def cached(self, name, backend=DEFAULT_BACKEND):
+        key = (backend, name)
+        with self.lock:
+            model = self.models.get(key)
+            if model is not None:
+                self.models.move_to_end(key)
+            return model
+
+    def load(self, name, backend=DEFAULT_BACKEND):
+        model = self.cached(name, backend)
+        if model is not None:
+            return model
+
+        model = get_backend(backend).load(name)
+        with self.lock:
+            self.models[(backend, name)] = model
+            while len(self.models) > self.max_models:
+                self.models.popitem(last=False)
+        return model
+
+    def load_async(self, name, on_ready, on_error=None, backend=DEFAULT_BACKEND):
+        def run():
+            try:
+                model = self.load(name, backend)
+            except Exception as e:
+                if on_error:
+                    on_error(name, backend, e)
+                return
+            on_ready(name, backend, model)
+
+        thread = threading.Thread(target=run, name=f"whisper-load-{backend}-{name}", daemon=True)
+        thread.start()
+        return thread
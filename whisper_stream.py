@@ -0,0 +1,21 @@
+# whisper_stream.py
+import numpy as np
+from resampling import load_mono
+from vad import SAMPLE_RATE, split_on_silence
+
+
+def load_audio(file_path, sample_rate=SAMPLE_RATE):
+    return load_mono(file_path, sample_rate)
+
+
+def transcribe_stream(model, audio, sample_rate=SAMPLE_RATE, **vad_options):
+    if isinstance(audio, str):
+        audio = load_audio(audio, sample_rate)
+    elif audio.dtype != np.float32:
+        audio = audio.astype(np.float32) / 32768.0 if np.issubdtype(audio.dtype, np.integer) else audio.astype(np.float32)
+
+    for start, end in split_on_silence(audio, sample_rate, **vad_options):
+        result = model.transcribe(audio[start:end])
+        text = result["text"].strip()
+        if text:
+            yield {"start": start / sample_rate, "end": end / sample_rate, "text": text}